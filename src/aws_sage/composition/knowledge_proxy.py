@@ -3,19 +3,92 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import sys
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from functools import cache, lru_cache
+from heapq import nsmallest
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import Any, Final
 
 import httpx
+import orjson
 import structlog
 
+from aws_sage.config import get_config
+
 logger = structlog.get_logger()
+# Stdlib logger that structlog routes this module's events to; checked before
+# per-query debug events so filtered ones skip building the event entirely
+_stdlib_logger = logging.getLogger(__name__)
 
 # AWS documentation endpoints
 AWS_DOCS_BASE_URL = "https://docs.aws.amazon.com"
 AWS_KNOWLEDGE_MCP_URL = "https://knowledge-mcp.global.api.aws"
 
+# Documentation guides for services with a dedicated AWS docs entry
+_SERVICE_DOCS: Final[Mapping[str, Mapping[str, str]]] = MappingProxyType(
+    {
+        "s3": {
+            "url": f"{AWS_DOCS_BASE_URL}/AmazonS3/latest/userguide/",
+            "title": "Amazon S3 User Guide",
+        },
+        "ec2": {
+            "url": f"{AWS_DOCS_BASE_URL}/AWSEC2/latest/UserGuide/",
+            "title": "Amazon EC2 User Guide",
+        },
+        "lambda": {
+            "url": f"{AWS_DOCS_BASE_URL}/lambda/latest/dg/",
+            "title": "AWS Lambda Developer Guide",
+        },
+        "iam": {
+            "url": f"{AWS_DOCS_BASE_URL}/IAM/latest/UserGuide/",
+            "title": "IAM User Guide",
+        },
+        "rds": {
+            "url": f"{AWS_DOCS_BASE_URL}/AmazonRDS/latest/UserGuide/",
+            "title": "Amazon RDS User Guide",
+        },
+        "dynamodb": {
+            "url": f"{AWS_DOCS_BASE_URL}/amazondynamodb/latest/developerguide/",
+            "title": "DynamoDB Developer Guide",
+        },
+        "cloudformation": {
+            "url": f"{AWS_DOCS_BASE_URL}/AWSCloudFormation/latest/UserGuide/",
+            "title": "AWS CloudFormation User Guide",
+        },
+        "ecs": {
+            "url": f"{AWS_DOCS_BASE_URL}/AmazonECS/latest/developerguide/",
+            "title": "Amazon ECS Developer Guide",
+        },
+        "eks": {
+            "url": f"{AWS_DOCS_BASE_URL}/eks/latest/userguide/",
+            "title": "Amazon EKS User Guide",
+        },
+        "sns": {
+            "url": f"{AWS_DOCS_BASE_URL}/sns/latest/dg/",
+            "title": "Amazon SNS Developer Guide",
+        },
+        "sqs": {
+            "url": f"{AWS_DOCS_BASE_URL}/AWSSimpleQueueService/latest/SQSDeveloperGuide/",
+            "title": "Amazon SQS Developer Guide",
+        },
+    }
+)
+
+# Maximum number of items returned by a built-in knowledge search
+_MAX_RESULTS = 5
+
+# Maximum number of live query results kept in memory
+_LIVE_CACHE_MAX_ENTRIES = 512
+
 
 class KnowledgeCategory(Enum):
     """Categories of AWS knowledge."""
@@ -37,7 +110,7 @@ class KnowledgeSource(Enum):
     WEB_SEARCH = "web_search"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KnowledgeItem:
     """An item of AWS knowledge."""
 
@@ -49,60 +122,78 @@ class KnowledgeItem:
     source_type: KnowledgeSource = KnowledgeSource.BUILTIN
     source_url: str | None = None
     confidence: float = 1.0
-    related_services: list[str] = field(default_factory=list)
+    related_services: tuple[str, ...] = ()
+    _dict: dict[str, Any] = field(init=False, default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the serialized form of the (immutable) item."""
+        # A dict display with slot reads builds this about twice as fast as
+        # dict(zip(keys, attrgetter(*keys)(self))) plus fixing up the enum values
+        object.__setattr__(
+            self,
+            "_dict",
+            {
+                "title": self.title,
+                "content": self.content,
+                "category": self.category.value,
+                "service": self.service,
+                "source": self.source,
+                "source_type": self.source_type.value,
+                "source_url": self.source_url,
+                "confidence": self.confidence,
+                "related_services": list(self.related_services),
+            },
+        )
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "title": self.title,
-            "content": self.content,
-            "category": self.category.value,
-            "service": self.service,
-            "source": self.source,
-            "source_type": self.source_type.value,
-            "source_url": self.source_url,
-            "confidence": self.confidence,
-            "related_services": self.related_services,
-        }
+        """Convert to dictionary.
+
+        The dictionary is built once and shared between calls; treat it as read-only.
+        """
+        return self._dict
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LiveQueryResult:
     """Result from live knowledge query."""
 
     success: bool
-    items: list[KnowledgeItem] = field(default_factory=list)
+    items: tuple[KnowledgeItem, ...] = ()
     source: KnowledgeSource = KnowledgeSource.BUILTIN
     error: str | None = None
     fallback_used: bool = False
+    _dict: dict[str, Any] = field(init=False, default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the serialized form of the (immutable) result."""
+        object.__setattr__(
+            self,
+            "_dict",
+            {
+                "success": self.success,
+                "items": [item._dict for item in self.items],
+                "source": self.source.value,
+                "error": self.error,
+                "fallback_used": self.fallback_used,
+                "items_count": len(self.items),
+            },
+        )
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "success": self.success,
-            "items": [item.to_dict() for item in self.items],
-            "source": self.source.value,
-            "error": self.error,
-            "fallback_used": self.fallback_used,
-            "items_count": len(self.items),
-        }
+        """Convert to dictionary.
 
+        The dictionary is built once and shared between calls; treat it as read-only.
+        """
+        return self._dict
 
-class AWSKnowledgeProxy:
-    """
-    Proxy for AWS Knowledge MCP server.
 
-    This class provides integration with the official AWS Knowledge
-    MCP server for retrieving AWS best practices, architectural
-    guidance, and operational knowledge.
+@cache
+def _load_builtin() -> dict[str, tuple[KnowledgeItem, ...]]:
+    """Build the built-in knowledge for common questions on first use.
 
-    When the official AWS Knowledge MCP server is available, this proxy
-    will forward requests to it. Otherwise, it provides fallback
-    functionality using built-in knowledge.
+    Buckets are keyed by interned service name and frozen into tuples.
     """
-
-    # Built-in knowledge for common questions
-    BUILTIN_KNOWLEDGE: dict[str, list[KnowledgeItem]] = {
+    knowledge: dict[str, list[KnowledgeItem]] = {
         "s3": [
             KnowledgeItem(
                 title="S3 Bucket Naming Best Practices",
@@ -214,6 +305,103 @@ class AWSKnowledgeProxy:
             ),
         ],
     }
+    return {sys.intern(bucket): tuple(items) for bucket, items in knowledge.items()}
+
+
+class AWSKnowledgeProxy:
+    """
+    Proxy for AWS Knowledge MCP server.
+
+    This class provides integration with the official AWS Knowledge
+    MCP server for retrieving AWS best practices, architectural
+    guidance, and operational knowledge.
+
+    When the official AWS Knowledge MCP server is available, this proxy
+    will forward requests to it. Otherwise, it provides fallback
+    functionality using built-in knowledge.
+    """
+
+    # Index over the built-in knowledge, populated by _ensure_index() on first search
+    _INDEXED: bool = False
+    _ITEMS: tuple[KnowledgeItem, ...] = ()
+    _BUCKET_POSITIONS: dict[str, range] = {}
+    _CATEGORY_POSITIONS: dict[KnowledgeCategory, frozenset[int]] = {}
+    # Inverted index: each distinct search-text token maps to the items containing it.
+    # The tokens are also joined by NUL so keywords can be found inside them.
+    _TOKEN_POSITIONS: dict[str, frozenset[int]] = {}
+    _VOCAB: str = ""
+    _VOCAB_OFFSETS: list[int] = []
+    _VOCAB_POSITIONS: list[frozenset[int]] = []
+
+    @classmethod
+    def _ensure_index(cls) -> None:
+        """Flatten built-in knowledge and index item positions by bucket, category and token."""
+        if cls._INDEXED:
+            return
+        items: list[KnowledgeItem] = []
+        cls._BUCKET_POSITIONS = {}
+        for bucket, bucket_items in _load_builtin().items():
+            start = len(items)
+            items.extend(bucket_items)
+            cls._BUCKET_POSITIONS[bucket] = range(start, len(items))
+        cls._ITEMS = tuple(items)
+        cls._CATEGORY_POSITIONS = {
+            category: frozenset(
+                pos for pos, item in enumerate(cls._ITEMS) if item.category == category
+            )
+            for category in KnowledgeCategory
+        }
+
+        token_positions: dict[str, set[int]] = {}
+        # Search text is only needed to build the token index, so it isn't kept per item
+        for pos, item in enumerate(cls._ITEMS):
+            for token in f"{item.title} {item.content}".casefold().split():
+                token_positions.setdefault(token, set()).add(pos)
+        cls._TOKEN_POSITIONS = {
+            token: frozenset(positions) for token, positions in sorted(token_positions.items())
+        }
+        cls._VOCAB_OFFSETS = []
+        offset = 0
+        for token in cls._TOKEN_POSITIONS:
+            cls._VOCAB_OFFSETS.append(offset)
+            offset += len(token) + 1
+        cls._VOCAB = "\0".join(cls._TOKEN_POSITIONS)
+        cls._VOCAB_POSITIONS = list(cls._TOKEN_POSITIONS.values())
+        cls._INDEXED = True
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _canon_service(service: str | None) -> str | None:
+        """Normalize a service name to the interned lowercase form used as index keys."""
+        return sys.intern(service.lower()) if service else None
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _keyword_postings(cls, keyword: str) -> frozenset[int]:
+        """Return the positions of items whose text contains the keyword.
+
+        Keywords never contain whitespace, so every match lies inside a single
+        token. Scanning the distinct tokens (each once, however many items use
+        it) and unioning their postings gives the same result as testing every
+        item text.
+
+        Keywords are scanned one at a time rather than as a single alternation
+        regex: alternation reports one non-overlapping match per position, so
+        overlapping keywords such as "limit" and "limits" would be undercounted.
+        """
+        if "\0" in keyword:
+            return frozenset()
+
+        positions: set[int] = set()
+        offsets = cls._VOCAB_OFFSETS
+        start = cls._VOCAB.find(keyword)
+        while start != -1:
+            index = bisect_right(offsets, start) - 1
+            positions.update(cls._VOCAB_POSITIONS[index])
+            if index + 1 >= len(offsets):
+                break
+            start = cls._VOCAB.find(keyword, offsets[index + 1])
+        return frozenset(positions)
 
     def __init__(self, mcp_server_url: str | None = None):
         """
@@ -224,6 +412,29 @@ class AWSKnowledgeProxy:
         """
         self.mcp_server_url = mcp_server_url
         self._connected = False
+        self._http: httpx.AsyncClient | None = None
+        self._live_cache: OrderedDict[tuple[str, str | None], tuple[float, LiveQueryResult]] = (
+            OrderedDict()
+        )
+        self._live_inflight: dict[tuple[str, str | None], asyncio.Future[LiveQueryResult]] = {}
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive between queries instead
+        of paying a TCP and TLS handshake per request.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return self._http
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def connect(self) -> bool:
         """Connect to the AWS Knowledge MCP server."""
@@ -254,13 +465,33 @@ class AWSKnowledgeProxy:
         Returns:
             List of relevant knowledge items
         """
-        logger.info("querying_knowledge", question=question, service=service)
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("querying_knowledge", question=question, service=service)
 
         if self._connected and self.mcp_server_url:
             return await self._query_via_mcp(question, service, category)
 
         # Fallback: Search built-in knowledge
-        return self._search_builtin_knowledge(question, service, category)
+        return list(self._search_builtin_knowledge(question, service, category))
+
+    async def query_many(
+        self,
+        specs: Sequence[tuple[str, str | None, KnowledgeCategory | None]],
+    ) -> list[list[KnowledgeItem]]:
+        """
+        Run several knowledge queries concurrently.
+
+        Args:
+            specs: (question, service, category) for each query
+
+        Returns:
+            Results for each query, in the same order as specs
+        """
+        return list(
+            await asyncio.gather(
+                *(self.query(question, service, category) for question, service, category in specs)
+            )
+        )
 
     async def _query_via_mcp(
         self,
@@ -270,80 +501,114 @@ class AWSKnowledgeProxy:
     ) -> list[KnowledgeItem]:
         """Query via MCP server (placeholder)."""
         # This would use the MCP client to call the knowledge server
-        return self._search_builtin_knowledge(question, service, category)
+        return list(self._search_builtin_knowledge(question, service, category))
 
     def _search_builtin_knowledge(
         self,
         question: str,
         service: str | None,
         category: KnowledgeCategory | None,
-    ) -> list[KnowledgeItem]:
-        """Search built-in knowledge base."""
+    ) -> tuple[KnowledgeItem, ...]:
+        """Search built-in knowledge base.
+
+        Returns the memoized result tuple itself; copy it before handing it to
+        callers that may modify it.
+        """
+        # Matching ignores case, word order and spacing, so normalize all three for the cache key
+        question_key = " ".join(sorted(question.casefold().split()))
+        service_key = self._canon_service(service)
+        return self._search_builtin_cached(question_key, service_key, category)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _search_builtin_cached(
+        cls,
+        question_lower: str,
+        service: str | None,
+        category: KnowledgeCategory | None,
+    ) -> tuple[KnowledgeItem, ...]:
+        """Search built-in knowledge for a normalized question (memoized)."""
+        words = question_lower.split()
+        threshold = min(2, len(words) // 2 + 1)
+        keywords = [keyword for keyword in words if len(keyword) > 2]
+        if len(keywords) < threshold:
+            # Too few usable keywords for any item to reach the threshold
+            return ()
+
+        cls._ensure_index()
+        # Count keyword hits per item from the postings instead of scanning every item
+        if threshold == 1:
+            matched = set().union(*map(cls._keyword_postings, keywords))
+        else:
+            hits = Counter(chain.from_iterable(map(cls._keyword_postings, keywords)))
+            matched = {pos for pos, count in hits.items() if count >= threshold}
+        if category:
+            matched &= cls._CATEGORY_POSITIONS[category]
+
         results: list[KnowledgeItem] = []
-        question_lower = question.lower()
 
         # Search by service
-        if service and service.lower() in self.BUILTIN_KNOWLEDGE:
-            for item in self.BUILTIN_KNOWLEDGE[service.lower()]:
-                if category and item.category != category:
-                    continue
-                if self._matches_question(question_lower, item):
-                    results.append(item)
+        if service and service in cls._BUCKET_POSITIONS:
+            positions = cls._BUCKET_POSITIONS[service]
+            results.extend(
+                islice((cls._ITEMS[pos] for pos in positions if pos in matched), _MAX_RESULTS)
+            )
 
         # Search architecture knowledge
-        if not service or "architecture" in question_lower or "design" in question_lower:
-            for item in self.BUILTIN_KNOWLEDGE.get("architecture", []):
-                if category and item.category != category:
-                    continue
-                if self._matches_question(question_lower, item):
-                    results.append(item)
+        if len(results) < _MAX_RESULTS and (
+            not service or "architecture" in question_lower or "design" in question_lower
+        ):
+            positions = cls._BUCKET_POSITIONS.get("architecture", range(0))
+            results.extend(
+                islice(
+                    (cls._ITEMS[pos] for pos in positions if pos in matched),
+                    _MAX_RESULTS - len(results),
+                )
+            )
 
         # Search all services if no specific match
         if not results:
-            for items in self.BUILTIN_KNOWLEDGE.values():
-                for item in items:
-                    if category and item.category != category:
-                        continue
-                    if self._matches_question(question_lower, item):
-                        results.append(item)
+            results = [cls._ITEMS[pos] for pos in nsmallest(_MAX_RESULTS, matched)]
 
-        return results[:5]  # Limit results
+        return tuple(results)
 
-    def _matches_question(self, question: str, item: KnowledgeItem) -> bool:
-        """Check if a knowledge item matches the question."""
-        # Simple keyword matching
-        keywords = question.split()
-        item_text = (item.title + " " + item.content).lower()
+    def _by_service_and_category(
+        self, service: str, category: KnowledgeCategory
+    ) -> list[KnowledgeItem]:
+        """Get the built-in items for a service in one category."""
+        bucket = _load_builtin().get(self._canon_service(service) or "", ())
+        return [item for item in bucket if item.category is category][:_MAX_RESULTS]
 
-        matched = 0
-        for keyword in keywords:
-            if len(keyword) > 2 and keyword in item_text:
-                matched += 1
+    async def _get_for_service(
+        self, question: str, service: str, category: KnowledgeCategory
+    ) -> list[KnowledgeItem]:
+        """Get items for a known (service, category) pair without keyword matching.
 
-        return matched >= min(2, len(keywords) // 2 + 1)
+        Falls back to a question search, which spans all services, when the
+        service has no built-in items in the category.
+        """
+        if not (self._connected and self.mcp_server_url):
+            items = self._by_service_and_category(service, category)
+            if items:
+                return items
+        return await self.query(question, service=service, category=category)
 
     async def get_best_practices(self, service: str) -> list[KnowledgeItem]:
         """Get best practices for a service."""
-        return await self.query(
-            f"best practices for {service}",
-            service=service,
-            category=KnowledgeCategory.BEST_PRACTICES,
+        return await self._get_for_service(
+            f"best practices for {service}", service, KnowledgeCategory.BEST_PRACTICES
         )
 
     async def get_security_guidance(self, service: str) -> list[KnowledgeItem]:
         """Get security guidance for a service."""
-        return await self.query(
-            f"security best practices for {service}",
-            service=service,
-            category=KnowledgeCategory.SECURITY,
+        return await self._get_for_service(
+            f"security best practices for {service}", service, KnowledgeCategory.SECURITY
         )
 
     async def get_service_limits(self, service: str) -> list[KnowledgeItem]:
         """Get service limits for a service."""
-        return await self.query(
-            f"limits and quotas for {service}",
-            service=service,
-            category=KnowledgeCategory.LIMITS,
+        return await self._get_for_service(
+            f"limits and quotas for {service}", service, KnowledgeCategory.LIMITS
         )
 
     async def query_live(
@@ -367,30 +632,77 @@ class AWSKnowledgeProxy:
         Returns:
             LiveQueryResult with items from live or fallback sources
         """
-        logger.info("querying_knowledge_live", question=question, service=service)
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("querying_knowledge_live", question=question, service=service)
+
+        # Serve repeated questions from the cache. Stale entries are still
+        # returned immediately while a background lookup refreshes them.
+        cache_key = (question.strip().casefold(), self._canon_service(service))
+        cached = self._live_cache.get(cache_key)
+        if cached:
+            self._live_cache.move_to_end(cache_key)
+            is_stale = time.monotonic() - cached[0] >= get_config().cache_ttl_seconds
+            if is_stale and cache_key not in self._live_inflight:
+                self._start_live_fetch(question, service, timeout, cache_key)
+            return cached[1]
+
+        # Concurrent callers asking the same question share one in-flight lookup
+        task = self._live_inflight.get(cache_key)
+        if task is None:
+            task = self._start_live_fetch(question, service, timeout, cache_key)
+        # Shield the shared lookup so one caller's cancellation doesn't fail the others
+        return await asyncio.shield(task)
+
+    def _start_live_fetch(
+        self,
+        question: str,
+        service: str | None,
+        timeout: float,
+        cache_key: tuple[str, str | None],
+    ) -> asyncio.Future[LiveQueryResult]:
+        """Start a live lookup and register it as in flight until it finishes."""
+        task = asyncio.ensure_future(self._fetch_live(question, service, timeout, cache_key))
+        self._live_inflight[cache_key] = task
+        task.add_done_callback(lambda _: self._live_inflight.pop(cache_key, None))
+        return task
+
+    async def _fetch_live(
+        self,
+        question: str,
+        service: str | None,
+        timeout: float,
+        cache_key: tuple[str, str | None],
+    ) -> LiveQueryResult:
+        """Fetch a live result from external sources and cache it.
 
-        # Try AWS Knowledge MCP server first (if configured)
+        Failed lookups are not cached, so a stale entry keeps being served
+        until a refresh succeeds.
+        """
+        # Query sources one at a time in priority order: AWS Knowledge MCP
+        # server (if configured), then AWS docs. The docs lookup is a local
+        # memoized search, so running it alongside the MCP call saves nothing
+        lookups = [("aws_docs_query_failed", self._query_aws_docs)]
         if self.mcp_server_url:
+            lookups.insert(0, ("aws_knowledge_mcp_failed", self._query_aws_knowledge_mcp))
+
+        for failure_event, lookup in lookups:
             try:
-                result = await self._query_aws_knowledge_mcp(question, service, timeout)
-                if result.success and result.items:
-                    return result
+                result = await lookup(question, service, timeout)
             except Exception as e:
-                logger.warning("aws_knowledge_mcp_failed", error=str(e))
-
-        # Try AWS documentation search
-        try:
-            result = await self._query_aws_docs(question, service, timeout)
+                logger.warning(failure_event, error=str(e))
+                continue
             if result.success and result.items:
+                self._live_cache[cache_key] = (time.monotonic(), result)
+                self._live_cache.move_to_end(cache_key)
+                if len(self._live_cache) > _LIVE_CACHE_MAX_ENTRIES:
+                    # Evict the least recently used entry
+                    self._live_cache.popitem(last=False)
                 return result
-        except Exception as e:
-            logger.warning("aws_docs_query_failed", error=str(e))
 
         # Fallback to built-in knowledge
-        builtin_items = self._search_builtin_knowledge(question, service, None)
         return LiveQueryResult(
             success=True,
-            items=builtin_items,
+            items=self._search_builtin_knowledge(question, service, None),
             source=KnowledgeSource.BUILTIN,
             fallback_used=True,
         )
@@ -409,31 +721,35 @@ class AWSKnowledgeProxy:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    f"{self.mcp_server_url}/tools/call",
-                    json={
-                        "name": "aws___search_documentation",
-                        "arguments": {
-                            "query": question,
-                            "service": service,
-                        },
-                    },
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    items = self._parse_mcp_response(data, service)
-                    return LiveQueryResult(
-                        success=True,
-                        items=items,
-                        source=KnowledgeSource.AWS_KNOWLEDGE_MCP,
-                    )
-                else:
+            payload = {
+                "name": "aws___search_documentation",
+                "arguments": {
+                    "query": question,
+                    "service": service,
+                },
+            }
+            # Stream the response so error bodies are never downloaded
+            async with self._get_http_client().stream(
+                "POST",
+                f"{self.mcp_server_url}/tools/call",
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            ) as response:
+                if response.status_code != 200:
                     return LiveQueryResult(
                         success=False,
                         error=f"MCP server returned status {response.status_code}",
                     )
+                body = await response.aread()
+
+            # Decoding and building items is CPU work; keep it off the event loop
+            items = await asyncio.to_thread(self._decode_mcp_response, body, service)
+            return LiveQueryResult(
+                success=True,
+                items=tuple(items),
+                source=KnowledgeSource.AWS_KNOWLEDGE_MCP,
+            )
 
         except httpx.TimeoutException:
             return LiveQueryResult(
@@ -453,63 +769,25 @@ class AWSKnowledgeProxy:
         timeout: float,
     ) -> LiveQueryResult:
         """Query AWS documentation (simplified approach using service-specific docs)."""
+        return self._aws_docs_result(self._canon_service(service))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _aws_docs_result(service: str | None) -> LiveQueryResult:
+        """Build the documentation result for a normalized service name (memoized).
+
+        The result depends only on the service, so each one is built once and
+        the same immutable result is shared by every later query.
+        """
         # AWS documentation doesn't have a public search API, so we provide
         # guidance based on known documentation URLs
         items: list[KnowledgeItem] = []
 
-        # Map services to their documentation URLs
-        SERVICE_DOCS: dict[str, dict[str, str]] = {
-            "s3": {
-                "url": f"{AWS_DOCS_BASE_URL}/AmazonS3/latest/userguide/",
-                "title": "Amazon S3 User Guide",
-            },
-            "ec2": {
-                "url": f"{AWS_DOCS_BASE_URL}/AWSEC2/latest/UserGuide/",
-                "title": "Amazon EC2 User Guide",
-            },
-            "lambda": {
-                "url": f"{AWS_DOCS_BASE_URL}/lambda/latest/dg/",
-                "title": "AWS Lambda Developer Guide",
-            },
-            "iam": {
-                "url": f"{AWS_DOCS_BASE_URL}/IAM/latest/UserGuide/",
-                "title": "IAM User Guide",
-            },
-            "rds": {
-                "url": f"{AWS_DOCS_BASE_URL}/AmazonRDS/latest/UserGuide/",
-                "title": "Amazon RDS User Guide",
-            },
-            "dynamodb": {
-                "url": f"{AWS_DOCS_BASE_URL}/amazondynamodb/latest/developerguide/",
-                "title": "DynamoDB Developer Guide",
-            },
-            "cloudformation": {
-                "url": f"{AWS_DOCS_BASE_URL}/AWSCloudFormation/latest/UserGuide/",
-                "title": "AWS CloudFormation User Guide",
-            },
-            "ecs": {
-                "url": f"{AWS_DOCS_BASE_URL}/AmazonECS/latest/developerguide/",
-                "title": "Amazon ECS Developer Guide",
-            },
-            "eks": {
-                "url": f"{AWS_DOCS_BASE_URL}/eks/latest/userguide/",
-                "title": "Amazon EKS User Guide",
-            },
-            "sns": {
-                "url": f"{AWS_DOCS_BASE_URL}/sns/latest/dg/",
-                "title": "Amazon SNS Developer Guide",
-            },
-            "sqs": {
-                "url": f"{AWS_DOCS_BASE_URL}/AWSSimpleQueueService/latest/SQSDeveloperGuide/",
-                "title": "Amazon SQS Developer Guide",
-            },
-        }
-
-        if service and service.lower() in SERVICE_DOCS:
-            doc_info = SERVICE_DOCS[service.lower()]
+        if service and service in _SERVICE_DOCS:
+            doc_info = _SERVICE_DOCS[service]
             items.append(
                 KnowledgeItem(
-                    title=f"{doc_info['title']}",
+                    title=doc_info["title"],
                     content=f"For detailed information about {service.upper()}, "
                     f"refer to the official AWS documentation.",
                     category=KnowledgeCategory.BEST_PRACTICES,
@@ -538,44 +816,54 @@ class AWSKnowledgeProxy:
 
         return LiveQueryResult(
             success=True,
-            items=items,
+            items=tuple(items),
             source=KnowledgeSource.AWS_DOCS,
         )
 
+    def _decode_mcp_response(self, body: bytes, service: str | None) -> list[KnowledgeItem]:
+        """Decode a raw AWS Knowledge MCP response body into knowledge items."""
+        return self._parse_mcp_response(orjson.loads(body), service)
+
     def _parse_mcp_response(
         self, data: dict[str, Any], service: str | None
     ) -> list[KnowledgeItem]:
         """Parse response from AWS Knowledge MCP server."""
-        items: list[KnowledgeItem] = []
-
         # Parse the MCP response format
         results = data.get("results", data.get("content", []))
-        if isinstance(results, list):
-            for result in results[:5]:  # Limit to 5 items
-                if isinstance(result, dict):
-                    items.append(
-                        KnowledgeItem(
-                            title=result.get("title", "AWS Documentation"),
-                            content=result.get("content", result.get("text", "")),
-                            category=KnowledgeCategory.BEST_PRACTICES,
-                            service=service,
-                            source="AWS Knowledge MCP",
-                            source_type=KnowledgeSource.AWS_KNOWLEDGE_MCP,
-                            source_url=result.get("url"),
-                            confidence=result.get("confidence", 0.9),
-                        )
-                    )
-
-        return items
+        if not isinstance(results, list):
+            return []
+
+        item_cls = KnowledgeItem
+        category = KnowledgeCategory.BEST_PRACTICES
+        source_type = KnowledgeSource.AWS_KNOWLEDGE_MCP
+        return [
+            item_cls(
+                title=result.get("title", "AWS Documentation"),
+                content=result.get("content", result.get("text", "")),
+                category=category,
+                service=service,
+                source="AWS Knowledge MCP",
+                source_type=source_type,
+                source_url=result.get("url"),
+                confidence=result.get("confidence", 0.9),
+            )
+            for result in results[:5]  # Limit to 5 items
+            if isinstance(result, dict)
+        ]
 
 
-# Global proxy instance
-_knowledge_proxy: AWSKnowledgeProxy | None = None
+# Global proxy instances, one per MCP server URL
+_knowledge_proxies: dict[str | None, AWSKnowledgeProxy] = {}
+_knowledge_proxies_lock = threading.Lock()
 
 
 def get_knowledge_proxy(mcp_server_url: str | None = None) -> AWSKnowledgeProxy:
-    """Get the global knowledge proxy instance."""
-    global _knowledge_proxy
-    if _knowledge_proxy is None:
-        _knowledge_proxy = AWSKnowledgeProxy(mcp_server_url)
-    return _knowledge_proxy
+    """Get the global knowledge proxy instance for an MCP server URL."""
+    proxy = _knowledge_proxies.get(mcp_server_url)
+    if proxy is None:
+        # Only the first callers for a URL take the lock; the proxy is built once
+        with _knowledge_proxies_lock:
+            proxy = _knowledge_proxies.get(mcp_server_url)
+            if proxy is None:
+                proxy = _knowledge_proxies[mcp_server_url] = AWSKnowledgeProxy(mcp_server_url)
+    return proxy
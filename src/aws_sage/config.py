@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import os
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Set
 
 
 class SafetyMode(Enum):
@@ -16,6 +16,10 @@ class SafetyMode(Enum):
     UNRESTRICTED = "unrestricted"  # All operations (still blocks denylist)
 
 
+# Safety modes keyed by their environment variable value
+_SAFETY_MODES_BY_VALUE: dict[str, SafetyMode] = {mode.value: mode for mode in SafetyMode}
+
+
 class OperationCategory(Enum):
     """Categories of AWS operations by their impact."""
 
@@ -25,20 +29,24 @@ class OperationCategory(Enum):
     BLOCKED = "blocked"  # operations that are never allowed
 
 
-@dataclass
+# Operation categories that need confirmation unless configured otherwise
+DEFAULT_CONFIRMATION_CATEGORIES: frozenset[OperationCategory] = frozenset(
+    {OperationCategory.WRITE, OperationCategory.DESTRUCTIVE}
+)
+
+
+@dataclass(slots=True)
 class SafetyConfig:
     """Configuration for safety controls."""
 
     mode: SafetyMode = SafetyMode.READ_ONLY
-    require_confirmation_for: Set[OperationCategory] = field(
-        default_factory=lambda: {OperationCategory.WRITE, OperationCategory.DESTRUCTIVE}
-    )
+    require_confirmation_for: frozenset[OperationCategory] = DEFAULT_CONFIRMATION_CATEGORIES
     dry_run_when_available: bool = True
     max_resources_per_operation: int = 50
     audit_logging: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalStackConfig:
     """Configuration for LocalStack integration."""
 
@@ -55,7 +63,7 @@ class LocalStackConfig:
         return f"{protocol}://{self.host}:{self.port}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Main server configuration."""
 
@@ -73,6 +81,9 @@ class ServerConfig:
     pagination_max_items: int = 1000
     cache_ttl_seconds: int = 300
 
+    # Output
+    format_tables: bool = True  # Include markdown tables alongside JSON data
+
     # Context
     max_recent_resources: int = 10
     persist_context: bool = False
@@ -81,11 +92,9 @@ class ServerConfig:
     @classmethod
     def from_env(cls) -> "ServerConfig":
         """Load configuration from environment variables."""
-        safety_mode_str = os.environ.get("AWS_SAGE_SAFETY_MODE", "read_only")
-        try:
-            safety_mode = SafetyMode(safety_mode_str)
-        except ValueError:
-            safety_mode = SafetyMode.READ_ONLY
+        safety_mode = _SAFETY_MODES_BY_VALUE.get(
+            os.environ.get("AWS_SAGE_SAFETY_MODE", "read_only"), SafetyMode.READ_ONLY
+        )
 
         return cls(
             default_region=os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
@@ -101,19 +110,26 @@ class ServerConfig:
                 auto_detect=os.environ.get("AWS_SAGE_LOCALSTACK_AUTO_DETECT", "true").lower()
                 == "true",
             ),
+            format_tables=os.environ.get("AWS_SAGE_FORMAT_TABLES", "true").lower() == "true",
         )
 
 
 # Global configuration instance
 _config: ServerConfig | None = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> ServerConfig:
     """Get the global configuration instance."""
     global _config
-    if _config is None:
-        _config = ServerConfig.from_env()
-    return _config
+    config = _config
+    if config is None:
+        # Only the first callers take the lock; from_env runs once
+        with _config_lock:
+            config = _config
+            if config is None:
+                config = _config = ServerConfig.from_env()
+    return config
 
 
 def set_config(config: ServerConfig) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import re
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -191,8 +192,6 @@ class ConversationContext:
         result = text
         for name, value in self.aliases.items():
             # Replace whole word matches only
-            import re
-
             result = re.sub(rf"\b{re.escape(name)}\b", value, result, flags=re.IGNORECASE)
         return result
 
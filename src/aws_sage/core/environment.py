@@ -15,85 +15,89 @@ class EnvironmentType(Enum):
 
 
 # Services available in LocalStack Community Edition
-LOCALSTACK_COMMUNITY_SERVICES: set[str] = {
-    # Core services
-    "acm",
-    "apigateway",
-    "cloudformation",
-    "cloudwatch",
-    "config",
-    "dynamodb",
-    "dynamodbstreams",
-    "ec2",
-    "ecr",
-    "ecs",
-    "elasticbeanstalk",
-    "events",
-    "firehose",
-    "iam",
-    "kinesis",
-    "kms",
-    "lambda",
-    "logs",
-    "opensearch",
-    "redshift",
-    "resourcegroupstaggingapi",
-    "route53",
-    "route53resolver",
-    "s3",
-    "s3control",
-    "secretsmanager",
-    "ses",
-    "sns",
-    "sqs",
-    "ssm",
-    "stepfunctions",
-    "sts",
-    "transcribe",
-}
+LOCALSTACK_COMMUNITY_SERVICES: frozenset[str] = frozenset(
+    {
+        # Core services
+        "acm",
+        "apigateway",
+        "cloudformation",
+        "cloudwatch",
+        "config",
+        "dynamodb",
+        "dynamodbstreams",
+        "ec2",
+        "ecr",
+        "ecs",
+        "elasticbeanstalk",
+        "events",
+        "firehose",
+        "iam",
+        "kinesis",
+        "kms",
+        "lambda",
+        "logs",
+        "opensearch",
+        "redshift",
+        "resourcegroupstaggingapi",
+        "route53",
+        "route53resolver",
+        "s3",
+        "s3control",
+        "secretsmanager",
+        "ses",
+        "sns",
+        "sqs",
+        "ssm",
+        "stepfunctions",
+        "sts",
+        "transcribe",
+    }
+)
 
 # Services that require LocalStack Pro
-LOCALSTACK_PRO_SERVICES: set[str] = {
-    "amplify",
-    "appsync",
-    "athena",
-    "backup",
-    "batch",
-    "ce",  # Cost Explorer - Pro only
-    "cloudfront",
-    "codeartifact",
-    "codecommit",
-    "cognito-identity",
-    "cognito-idp",
-    "docdb",
-    "elasticache",
-    "elasticloadbalancing",
-    "elasticloadbalancingv2",
-    "emr",
-    "glue",
-    "iot",
-    "lakeformation",
-    "mediastore",
-    "mq",
-    "mwaa",
-    "neptune",
-    "organizations",
-    "pricing",  # Pricing API - Pro only
-    "qldb",
-    "rds",
-    "redshift-data",
-    "sagemaker",
-    "servicediscovery",
-    "shield",
-    "timestream",
-    "transfer",
-    "waf",
-    "wafv2",
-    "xray",
-}
-
-
-@dataclass
+LOCALSTACK_PRO_SERVICES: frozenset[str] = frozenset(
+    {
+        "amplify",
+        "appsync",
+        "athena",
+        "backup",
+        "batch",
+        "ce",  # Cost Explorer - Pro only
+        "cloudfront",
+        "codeartifact",
+        "codecommit",
+        "cognito-identity",
+        "cognito-idp",
+        "docdb",
+        "elasticache",
+        "elasticloadbalancing",
+        "elasticloadbalancingv2",
+        "emr",
+        "glue",
+        "iot",
+        "lakeformation",
+        "mediastore",
+        "mq",
+        "mwaa",
+        "neptune",
+        "organizations",
+        "pricing",  # Pricing API - Pro only
+        "qldb",
+        "rds",
+        "redshift-data",
+        "sagemaker",
+        "servicediscovery",
+        "shield",
+        "timestream",
+        "transfer",
+        "waf",
+        "wafv2",
+        "xray",
+    }
+)
+
+
+@dataclass(slots=True)
 class EnvironmentConfig:
     """Configuration for an AWS environment."""
 
@@ -105,12 +109,19 @@ class EnvironmentConfig:
     secret_access_key: str | None = None
     is_active: bool = False
     description: str = ""
-    available_services: set[str] = field(default_factory=set)
+    available_services: frozenset[str] = frozenset()
+    # Client kwargs and the (endpoint, region, keys) they were built from
+    _client_kwargs: dict[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _client_kwargs_key: tuple[str | None, str, str | None, str | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Set available services based on environment type."""
         if self.type == EnvironmentType.LOCALSTACK and not self.available_services:
-            self.available_services = LOCALSTACK_COMMUNITY_SERVICES.copy()
+            self.available_services = LOCALSTACK_COMMUNITY_SERVICES
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -130,21 +141,30 @@ class EnvironmentConfig:
             return True  # All services available in production
         return service.lower() in self.available_services
 
-    def get_client_kwargs(self, service: str) -> dict:
-        """Get boto3 client kwargs for this environment."""
-        kwargs: dict = {}
+    def get_client_kwargs(self, service: str) -> dict[str, str]:
+        """Get boto3 client kwargs for this environment.
+
+        The kwargs are rebuilt only when the endpoint, region or keys change;
+        callers get their own copy and may modify it.
+        """
+        key = (self.endpoint_url, self.region, self.access_key_id, self.secret_access_key)
+        if self._client_kwargs is None or self._client_kwargs_key != key:
+            kwargs: dict[str, str] = {}
+
+            if self.endpoint_url:
+                kwargs["endpoint_url"] = self.endpoint_url
 
-        if self.endpoint_url:
-            kwargs["endpoint_url"] = self.endpoint_url
+            if self.region:
+                kwargs["region_name"] = self.region
 
-        if self.region:
-            kwargs["region_name"] = self.region
+            if self.access_key_id and self.secret_access_key:
+                kwargs["aws_access_key_id"] = self.access_key_id
+                kwargs["aws_secret_access_key"] = self.secret_access_key
 
-        if self.access_key_id and self.secret_access_key:
-            kwargs["aws_access_key_id"] = self.access_key_id
-            kwargs["aws_secret_access_key"] = self.secret_access_key
+            self._client_kwargs = kwargs
+            self._client_kwargs_key = key
 
-        return kwargs
+        return dict(self._client_kwargs)
 
 
 # Default environment configurations
@@ -26,11 +26,9 @@ class AuthenticationError(AWSMCPError):
     """Raised when AWS authentication fails."""
 
     def __init__(self, message: str, profile: str | None = None, suggestion: str | None = None):
-        details = {}
-        if profile:
-            details["profile"] = profile
-        if suggestion:
-            details["suggestion"] = suggestion
+        details = {
+            key: value for key, value in (("profile", profile), ("suggestion", suggestion)) if value
+        }
         super().__init__(message, details)
 
 
@@ -45,15 +43,16 @@ class SafetyError(AWSMCPError):
         current_mode: str | None = None,
         suggested_mode: str | None = None,
     ):
-        details = {}
-        if operation:
-            details["operation"] = operation
-        if category:
-            details["category"] = category
-        if current_mode:
-            details["current_mode"] = current_mode
-        if suggested_mode:
-            details["suggested_mode"] = suggested_mode
+        details = {
+            key: value
+            for key, value in (
+                ("operation", operation),
+                ("category", category),
+                ("current_mode", current_mode),
+                ("suggested_mode", suggested_mode),
+            )
+            if value
+        }
         super().__init__(message, details)
 
 
@@ -79,15 +78,16 @@ class ValidationError(AWSMCPError):
         received: str | None = None,
         suggestions: list[str] | None = None,
     ):
-        details = {}
-        if field:
-            details["field"] = field
-        if expected:
-            details["expected"] = expected
-        if received:
-            details["received"] = received
-        if suggestions:
-            details["suggestions"] = suggestions
+        details = {
+            key: value
+            for key, value in (
+                ("field", field),
+                ("expected", expected),
+                ("received", received),
+                ("suggestions", suggestions),
+            )
+            if value
+        }
         super().__init__(message, details)
 
 
@@ -100,11 +100,11 @@ class ParseError(AWSMCPError):
         input_text: str | None = None,
         suggestions: list[str] | None = None,
     ):
-        details = {}
-        if input_text:
-            details["input"] = input_text
-        if suggestions:
-            details["suggestions"] = suggestions
+        details = {
+            key: value
+            for key, value in (("input", input_text), ("suggestions", suggestions))
+            if value
+        }
         super().__init__(message, details)
 
 
@@ -120,15 +120,15 @@ class ExecutionError(AWSMCPError):
         recoverable: bool = False,
         retry_after: int | None = None,
     ):
-        details = {
-            "recoverable": recoverable,
-        }
-        if service:
-            details["service"] = service
-        if operation:
-            details["operation"] = operation
-        if aws_error_code:
-            details["aws_error_code"] = aws_error_code
-        if retry_after:
-            details["retry_after_seconds"] = retry_after
+        details: dict[str, Any] = {"recoverable": recoverable}
+        details.update(
+            (key, value)
+            for key, value in (
+                ("service", service),
+                ("operation", operation),
+                ("aws_error_code", aws_error_code),
+                ("retry_after_seconds", retry_after),
+            )
+            if value
+        )
         super().__init__(message, details)
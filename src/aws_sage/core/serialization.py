@@ -0,0 +1,43 @@
+"""JSON serialization for tool responses."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+
+
+def _default(obj: Any) -> Any:
+    """Serialize values orjson doesn't handle natively."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize an object to an indented JSON string.
+
+    orjson encodes datetimes natively and runs in C, which keeps large AWS
+    responses from dominating tool latency.
+    """
+    return orjson.dumps(
+        obj,
+        default=_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+def dumps_log_json(obj: Any, **kwargs: Any) -> str:
+    """Serializer for structlog's JSONRenderer, backed by orjson."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+def dumps_ndjson(items: Iterable[Any]) -> str:
+    """Serialize items as newline-delimited JSON, one compact object per line.
+
+    Consumers can process rows as they arrive instead of parsing one large
+    document, and no indentation is spent on big result lists.
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    return b"".join(orjson.dumps(item, default=_default, option=option) for item in items).decode()
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import configparser
 import json
+import os
+import time
 from dataclasses import dataclass, field
-from pathlib import Path
+from functools import lru_cache
 from typing import Any
 
 import boto3
+import botocore.session
 import structlog
-from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
+from botocore.configloader import load_config, raw_config_parse
+from botocore.exceptions import (
+    ClientError,
+    ConfigNotFound,
+    ConfigParseError,
+    NoCredentialsError,
+    ProfileNotFound,
+)
+from botocore.utils import JSONFileCache
 
 from aws_sage.config import get_config
 from aws_sage.core.exceptions import AuthenticationError
@@ -31,7 +44,154 @@ def _get_env_manager():
 logger = structlog.get_logger()
 
 
-@dataclass
+# Resolved once: expanding "~" may hit the password database on every call
+_AWS_DIR = os.path.join(os.path.expanduser("~"), ".aws")
+_AWS_CLI_CACHE_DIR = os.path.join(_AWS_DIR, "cli", "cache")
+_AWS_CONFIG_FILES = (
+    ("AWS_CONFIG_FILE", os.path.join(_AWS_DIR, "config")),
+    ("AWS_SHARED_CREDENTIALS_FILE", os.path.join(_AWS_DIR, "credentials")),
+)
+
+# Config keys that identify a profile's type, in priority order (SSO first)
+_PROFILE_TYPE_PRIORITY = (
+    ("sso_start_url", "sso"),
+    ("role_arn", "assume_role"),
+    ("source_profile", "chained"),
+)
+_PROFILE_TYPE_KEYS = frozenset(key for key, _ in _PROFILE_TYPE_PRIORITY)
+
+# How long a failed STS identity lookup is remembered before retrying
+_ACCOUNT_INFO_RETRY_SECONDS = 60.0
+
+
+# botocore data loader shared by every session we create
+_data_loader = None
+
+
+def _share_data_loader(botocore_session: botocore.session.Session) -> None:
+    """Make a botocore session use the process-wide data loader.
+
+    The loader caches the endpoint, partition and service model JSON it has
+    read, so sessions for other profiles or regions don't parse them again.
+    """
+    global _data_loader
+    if _data_loader is None:
+        _data_loader = botocore_session.get_component("data_loader")
+    else:
+        botocore_session.register_component("data_loader", _data_loader)
+
+
+def create_session(profile: str | None = None, region: str | None = None) -> boto3.Session:
+    """Create a boto3 session that shares the AWS CLI credential cache.
+
+    Assume-role and MFA profiles reuse temporary credentials cached in
+    ~/.aws/cli/cache instead of calling STS (and prompting) on every start.
+    """
+    botocore_session = botocore.session.Session(profile=profile)
+    _share_data_loader(botocore_session)
+    provider = botocore_session.get_component("credential_provider").get_provider("assume-role")
+    provider.cache = JSONFileCache(_AWS_CLI_CACHE_DIR)
+    return boto3.Session(botocore_session=botocore_session, region_name=region)
+
+
+def _aws_config_files_state() -> tuple[Any, ...]:
+    """Return the paths and modification times of the shared AWS config files."""
+    state = []
+    for env_var, default in _AWS_CONFIG_FILES:
+        # Env overrides are read on every call; only the defaults are precomputed
+        path = os.environ.get(env_var)
+        path = default if path is None else os.path.expanduser(path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        state.append((path, mtime))
+    return tuple(state)
+
+
+@lru_cache(maxsize=4)
+def _list_profiles_cached(files_state: tuple[Any, ...]) -> tuple[str, ...]:
+    """List profile names for a given config files state (memoized).
+
+    Keyed by the files' paths and modification times, so every session
+    manager shares the result until one of the files changes.
+    """
+    (config_path, config_mtime), (credentials_path, credentials_mtime) = files_state
+    try:
+        # Read the two files directly rather than building a botocore session
+        names = set()
+        if config_mtime is not None:
+            names.update(load_config(config_path)["profiles"])
+        if credentials_mtime is not None:
+            names.update(raw_config_parse(credentials_path))
+    except (ConfigNotFound, ConfigParseError):
+        # Let botocore resolve (and report) anything unusual about the files
+        names = set(botocore.session.Session().available_profiles)
+    profiles = tuple(sorted(names))
+    # Runs only when the config files change, not on every listing
+    logger.debug("listed_profiles", count=len(profiles))
+    return profiles
+
+
+@lru_cache(maxsize=4)
+def _profile_names_cached(files_state: tuple[Any, ...]) -> frozenset[str]:
+    """Profile names as a set for membership checks (memoized like the list)."""
+    return frozenset(_list_profiles_cached(files_state))
+
+
+@lru_cache(maxsize=4)
+def _profile_types_cached(files_state: tuple[Any, ...]) -> tuple[tuple[str, str], ...]:
+    """Classify every profile for a given config files state (memoized).
+
+    Returns (name, type) pairs. Like _list_profiles_cached, the result is
+    reused without any file I/O until one of the files changes.
+    """
+    (config_path, config_mtime), (credentials_path, credentials_mtime) = files_state
+    # Each file is parsed once for all profiles (and reused until it changes)
+    config_sections = _load_aws_ini(config_path, config_mtime)
+    credential_sections = _load_aws_ini(credentials_path, credentials_mtime)
+
+    profile_types = []
+    for profile in _list_profiles_cached(files_state):
+        section = config_sections.get(
+            f"profile {profile}" if profile != "default" else "default", frozenset()
+        )
+        # One set intersection, then the first match in priority order
+        hits = section & _PROFILE_TYPE_KEYS
+        profile_type = next((t for key, t in _PROFILE_TYPE_PRIORITY if key in hits), "unknown")
+
+        # Check if credentials exist
+        if profile_type == "unknown" and profile in credential_sections:
+            profile_type = "static"
+
+        profile_types.append((profile, profile_type))
+    return tuple(profile_types)
+
+
+@lru_cache(maxsize=8)
+def _load_aws_ini(path: str, mtime: int | None) -> dict[str, frozenset[str]]:
+    """Parse an AWS config or credentials file into {section: key names}.
+
+    Cached per (path, mtime) so a file is only re-parsed after it changes.
+    Missing or unparseable files yield no sections. This is already a single
+    pass over the file; configparser is kept over a hand-rolled regex because
+    it handles comments, continuation lines and whitespace the way the AWS
+    CLI does. Only key names are kept: profile types depend on which keys are
+    present, and the cache then never holds credential values.
+    """
+    if mtime is None:
+        return {}
+    parser = configparser.RawConfigParser(strict=False)
+    try:
+        # Feed the open file to the parser line by line instead of reading it whole
+        with open(path, encoding="utf-8") as f:
+            parser.read_file(f, source=path)
+    except (configparser.Error, OSError, UnicodeDecodeError):
+        return {}
+    return {section: frozenset(parser[section]) for section in parser.sections()}
+
+
+@dataclass(slots=True)
 class AccountInfo:
     """Information about the current AWS account."""
 
@@ -42,7 +202,47 @@ class AccountInfo:
     region: str | None = None
 
 
-@dataclass
+def _validate_credentials(session: boto3.Session, profile: str, region: str) -> AccountInfo:
+    """Call STS GetCallerIdentity and map failures to AuthenticationError."""
+    try:
+        identity = session.client("sts").get_caller_identity()
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code", "Unknown")
+        error_message = e.response.get("Error", {}).get("Message", str(e))
+
+        if error_code in ["ExpiredToken", "ExpiredTokenException"]:
+            raise AuthenticationError(
+                f"Credentials expired for profile '{profile}'",
+                profile=profile,
+                suggestion=f"Run 'aws sso login --profile {profile}' to refresh credentials",
+            ) from e
+        elif error_code == "AccessDenied":
+            raise AuthenticationError(
+                f"Access denied for profile '{profile}'",
+                profile=profile,
+                suggestion="Check IAM permissions or refresh SSO credentials",
+            ) from e
+        else:
+            raise AuthenticationError(
+                f"Authentication failed: {error_message}", profile=profile
+            ) from e
+    except NoCredentialsError:
+        raise AuthenticationError(
+            f"No credentials found for profile '{profile}'",
+            profile=profile,
+            suggestion="Run 'aws configure' or 'aws sso login' to set up credentials",
+        ) from None
+
+    return AccountInfo(
+        account_id=identity["Account"],
+        user_id=identity["UserId"],
+        arn=identity["Arn"],
+        profile=profile,
+        region=region,
+    )
+
+
+@dataclass(slots=True)
 class SessionManager:
     """Manages AWS sessions and credentials."""
 
@@ -50,69 +250,41 @@ class SessionManager:
     active_region: str = field(default_factory=lambda: get_config().default_region)
     _session: boto3.Session | None = field(default=None, repr=False)
     _account_info: AccountInfo | None = field(default=None, repr=False)
+    _account_info_failed_at: float | None = field(default=None, repr=False)
+    _clients: dict[tuple[Any, ...], Any] = field(default_factory=dict, repr=False)
+    _resources: dict[tuple[Any, ...], Any] = field(default_factory=dict, repr=False)
 
     def list_profiles(self) -> list[str]:
-        """List all available AWS profiles."""
+        """List all available AWS profiles.
+
+        Parsing the AWS config files is only repeated when one of them changes.
+        """
         try:
-            session = boto3.Session()
-            profiles = session.available_profiles
-            logger.info("listed_profiles", count=len(profiles))
-            return sorted(profiles)
+            profiles = _list_profiles_cached(_aws_config_files_state())
         except Exception as e:
             logger.error("failed_to_list_profiles", error=str(e))
             return []
+        return list(profiles)
 
     def get_profile_details(self) -> list[dict[str, Any]]:
         """Get detailed information about all profiles."""
-        profiles = self.list_profiles()
-        details = []
-
-        config_path = Path.home() / ".aws" / "config"
-        credentials_path = Path.home() / ".aws" / "credentials"
-
-        for profile in profiles:
-            info: dict[str, Any] = {"name": profile, "type": "unknown"}
-
-            # Check if it's an SSO profile
-            if config_path.exists():
-                try:
-                    content = config_path.read_text()
-                    profile_section = f"[profile {profile}]" if profile != "default" else "[default]"
-                    if profile_section in content:
-                        section_start = content.find(profile_section)
-                        section_end = content.find("\n[", section_start + 1)
-                        section = (
-                            content[section_start:section_end]
-                            if section_end > 0
-                            else content[section_start:]
-                        )
-                        if "sso_start_url" in section:
-                            info["type"] = "sso"
-                        elif "role_arn" in section:
-                            info["type"] = "assume_role"
-                        elif "source_profile" in section:
-                            info["type"] = "chained"
-                except Exception:
-                    pass
-
-            # Check if credentials exist
-            if credentials_path.exists() and info["type"] == "unknown":
-                try:
-                    content = credentials_path.read_text()
-                    if f"[{profile}]" in content:
-                        info["type"] = "static"
-                except Exception:
-                    pass
-
-            details.append(info)
-
-        return details
+        try:
+            profile_types = _profile_types_cached(_aws_config_files_state())
+        except Exception as e:
+            logger.error("failed_to_list_profiles", error=str(e))
+            return []
+        return [{"name": name, "type": profile_type} for name, profile_type in profile_types]
 
     def select_profile(self, profile: str, region: str | None = None) -> AccountInfo:
         """Select an AWS profile and validate credentials."""
-        # Check if profile exists
-        available = self.list_profiles()
-        if profile not in available:
+        # Check if profile exists; the sorted list is only needed for the error
+        try:
+            known = _profile_names_cached(_aws_config_files_state())
+        except Exception as e:
+            logger.error("failed_to_list_profiles", error=str(e))
+            known = frozenset()
+        if profile not in known:
+            available = self.list_profiles()
             raise AuthenticationError(
                 f"Profile '{profile}' not found",
                 profile=profile,
@@ -122,70 +294,57 @@ class SessionManager:
         # Create new session
         region_to_use = region or self.active_region
         try:
-            self._session = boto3.Session(profile_name=profile, region_name=region_to_use)
+            self._session = create_session(profile, region_to_use)
+            self._clients.clear()
+            self._resources.clear()
+            self._account_info_failed_at = None
         except ProfileNotFound:
             raise AuthenticationError(f"Profile '{profile}' not found in AWS config", profile=profile)
 
         # Validate credentials
-        try:
-            sts = self._session.client("sts")
-            identity = sts.get_caller_identity()
-
-            self.active_profile = profile
-            self.active_region = region_to_use
-            self._account_info = AccountInfo(
-                account_id=identity["Account"],
-                user_id=identity["UserId"],
-                arn=identity["Arn"],
-                profile=profile,
-                region=region_to_use,
-            )
-
-            logger.info(
-                "profile_selected",
-                profile=profile,
-                region=region_to_use,
-                account_id=identity["Account"],
-            )
-
-            return self._account_info
-
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
+        self._account_info = _validate_credentials(self._session, profile, region_to_use)
+        self.active_profile = profile
+        self.active_region = region_to_use
+
+        logger.info(
+            "profile_selected",
+            profile=profile,
+            region=region_to_use,
+            account_id=self._account_info.account_id,
+        )
+
+        return self._account_info
+
+    async def validate_profiles(
+        self, profiles: list[str], region: str | None = None
+    ) -> dict[str, AccountInfo | BaseException]:
+        """Validate credentials for several profiles concurrently.
+
+        Each STS call runs in a worker thread, so N profiles take roughly one
+        round trip instead of N. The active profile and session are left
+        untouched. Failures are returned per profile rather than raised.
+        """
+        region_to_use = region or self.active_region
 
-            if error_code in ["ExpiredToken", "ExpiredTokenException"]:
-                raise AuthenticationError(
-                    f"Credentials expired for profile '{profile}'",
-                    profile=profile,
-                    suggestion=f"Run 'aws sso login --profile {profile}' to refresh credentials",
-                )
-            elif error_code == "AccessDenied":
+        def validate(profile: str) -> AccountInfo:
+            try:
+                session = create_session(profile, region_to_use)
+            except ProfileNotFound:
                 raise AuthenticationError(
-                    f"Access denied for profile '{profile}'",
-                    profile=profile,
-                    suggestion="Check IAM permissions or refresh SSO credentials",
-                )
-            else:
-                raise AuthenticationError(f"Authentication failed: {error_message}", profile=profile)
+                    f"Profile '{profile}' not found in AWS config", profile=profile
+                ) from None
+            return _validate_credentials(session, profile, region_to_use)
 
-        except NoCredentialsError:
-            raise AuthenticationError(
-                f"No credentials found for profile '{profile}'",
-                profile=profile,
-                suggestion="Run 'aws configure' or 'aws sso login' to set up credentials",
-            )
+        results = await asyncio.gather(
+            *(asyncio.to_thread(validate, profile) for profile in profiles),
+            return_exceptions=True,
+        )
+        return dict(zip(profiles, results, strict=True))
 
     def get_session(self) -> boto3.Session:
         """Get the current boto3 session."""
         if self._session is None:
-            if self.active_profile:
-                self._session = boto3.Session(
-                    profile_name=self.active_profile,
-                    region_name=self.active_region,
-                )
-            else:
-                self._session = boto3.Session(region_name=self.active_region)
+            self._session = create_session(self.active_profile, self.active_region)
         return self._session
 
     def get_client(self, service: str, region: str | None = None) -> Any:
@@ -199,12 +358,21 @@ class SessionManager:
         # Get environment-specific kwargs (endpoint_url for LocalStack, etc.)
         env_kwargs = env_manager.get_client_kwargs(service, region or self.active_region)
 
-        # For LocalStack, use the environment kwargs directly
+        # For LocalStack, use the environment kwargs directly;
+        # for production, just use region
         if env_manager.is_localstack():
-            return session.client(service, **env_kwargs)
-
-        # For production, just use region
-        return session.client(service, region_name=region or self.active_region)
+            client_kwargs = env_kwargs
+        else:
+            client_kwargs = {"region_name": region or self.active_region}
+
+        # Client construction loads service models and endpoint data, so reuse
+        # clients for the lifetime of the current session
+        key = (service, *sorted(client_kwargs.items()))
+        client = self._clients.get(key)
+        if client is None:
+            client = session.client(service, **client_kwargs)
+            self._clients[key] = client
+        return client
 
     def get_resource(self, service: str, region: str | None = None) -> Any:
         """Get a boto3 resource for a service.
@@ -217,17 +385,37 @@ class SessionManager:
         # Get environment-specific kwargs (endpoint_url for LocalStack, etc.)
         env_kwargs = env_manager.get_client_kwargs(service, region or self.active_region)
 
-        # For LocalStack, use the environment kwargs directly
+        # For LocalStack, use the environment kwargs directly;
+        # for production, just use region
         if env_manager.is_localstack():
-            return session.resource(service, **env_kwargs)
-
-        # For production, just use region
-        return session.resource(service, region_name=region or self.active_region)
-
-    def get_account_info(self) -> AccountInfo | None:
-        """Get information about the current AWS account."""
-        if self._account_info:
-            return self._account_info
+            resource_kwargs = env_kwargs
+        else:
+            resource_kwargs = {"region_name": region or self.active_region}
+
+        # Resources wrap a client plus their own models, so reuse them like clients
+        key = (service, *sorted(resource_kwargs.items()))
+        resource = self._resources.get(key)
+        if resource is None:
+            resource = session.resource(service, **resource_kwargs)
+            self._resources[key] = resource
+        return resource
+
+    def get_account_info(self, force_refresh: bool = False) -> AccountInfo | None:
+        """Get information about the current AWS account.
+
+        The identity is cached for the session. A failed lookup is not retried
+        for _ACCOUNT_INFO_RETRY_SECONDS, so callers polling without valid
+        credentials don't pay an STS round trip each time. Pass
+        force_refresh=True to bypass both.
+        """
+        if not force_refresh:
+            if self._account_info:
+                return self._account_info
+            if (
+                self._account_info_failed_at is not None
+                and time.monotonic() - self._account_info_failed_at < _ACCOUNT_INFO_RETRY_SECONDS
+            ):
+                return None
 
         if self._session or self.active_profile:
             try:
@@ -240,24 +428,29 @@ class SessionManager:
                     profile=self.active_profile,
                     region=self.active_region,
                 )
+                self._account_info_failed_at = None
                 return self._account_info
             except Exception:
+                self._account_info_failed_at = time.monotonic()
                 return None
         return None
 
     def set_region(self, region: str) -> None:
-        """Set the active region."""
+        """Set the active region.
+
+        The session (and its resolved credentials) is kept: clients and
+        resources are created with an explicit region and cached per region,
+        so switching back to a previous region reuses them.
+        """
         self.active_region = region
-        # Reset session to use new region
-        if self._session:
-            self._session = boto3.Session(
-                profile_name=self.active_profile,
-                region_name=region,
-            )
         logger.info("region_changed", region=region)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert session state to dictionary."""
+        """Convert session state to dictionary.
+
+        Built on demand rather than cached: no request path calls this, and a
+        cache would need invalidating on every profile or region change.
+        """
         return {
             "active_profile": self.active_profile,
             "active_region": self.active_region,
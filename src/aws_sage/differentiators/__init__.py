@@ -1,48 +1,95 @@
-"""Unique differentiators for AWS MCP Pro."""
+"""Unique differentiators for AWS MCP Pro.
 
-from aws_sage.differentiators.compare import (
-    ComparisonResult,
-    EnvironmentComparer,
-    ResourceComparison,
-    ResourceDifference,
-    get_environment_comparer,
-    reset_environment_comparer,
-)
-from aws_sage.differentiators.cost import (
-    CostAnalysisResult,
-    CostAnalyzer,
-    CostBreakdown,
-    CostBreakdownItem,
-    CostProjection,
-    CostTrend,
-    IdleReason,
-    IdleResource,
-    ResourceProjection,
-    RightSizeAction,
-    RightSizeRecommendation,
-    get_cost_analyzer,
-    reset_cost_analyzer,
-)
-from aws_sage.differentiators.dependencies import (
-    DependencyGraph,
-    DependencyMapper,
-    DependencyType,
-    ResourceDependency,
-    get_dependency_mapper,
-)
-from aws_sage.differentiators.discovery import (
-    DiscoveredResource,
-    DiscoveryResult,
-    ResourceDiscovery,
-    get_resource_discovery,
-)
-from aws_sage.differentiators.workflows import (
-    IncidentInvestigator,
-    IncidentType,
-    InvestigationResult,
-    InvestigationStep,
-    get_incident_investigator,
-)
+Submodules are imported on first attribute access (PEP 562), so using one
+differentiator doesn't pay the import cost of the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aws_sage.differentiators.compare import (
+        ComparisonResult,
+        EnvironmentComparer,
+        ResourceComparison,
+        ResourceDifference,
+        get_environment_comparer,
+        reset_environment_comparer,
+    )
+    from aws_sage.differentiators.cost import (
+        CostAnalysisResult,
+        CostAnalyzer,
+        CostBreakdown,
+        CostBreakdownItem,
+        CostProjection,
+        CostTrend,
+        IdleReason,
+        IdleResource,
+        ResourceProjection,
+        RightSizeAction,
+        RightSizeRecommendation,
+        get_cost_analyzer,
+        reset_cost_analyzer,
+    )
+    from aws_sage.differentiators.dependencies import (
+        DependencyGraph,
+        DependencyMapper,
+        DependencyType,
+        ResourceDependency,
+        get_dependency_mapper,
+    )
+    from aws_sage.differentiators.discovery import (
+        DiscoveredResource,
+        DiscoveryResult,
+        ResourceDiscovery,
+        get_resource_discovery,
+    )
+    from aws_sage.differentiators.workflows import (
+        IncidentInvestigator,
+        IncidentType,
+        InvestigationResult,
+        InvestigationStep,
+        get_incident_investigator,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS: dict[str, str] = {
+    "ComparisonResult": "compare",
+    "EnvironmentComparer": "compare",
+    "ResourceComparison": "compare",
+    "ResourceDifference": "compare",
+    "get_environment_comparer": "compare",
+    "reset_environment_comparer": "compare",
+    "CostAnalysisResult": "cost",
+    "CostAnalyzer": "cost",
+    "CostBreakdown": "cost",
+    "CostBreakdownItem": "cost",
+    "CostProjection": "cost",
+    "CostTrend": "cost",
+    "IdleReason": "cost",
+    "IdleResource": "cost",
+    "ResourceProjection": "cost",
+    "RightSizeAction": "cost",
+    "RightSizeRecommendation": "cost",
+    "get_cost_analyzer": "cost",
+    "reset_cost_analyzer": "cost",
+    "DependencyGraph": "dependencies",
+    "DependencyMapper": "dependencies",
+    "DependencyType": "dependencies",
+    "ResourceDependency": "dependencies",
+    "get_dependency_mapper": "dependencies",
+    "DiscoveredResource": "discovery",
+    "DiscoveryResult": "discovery",
+    "ResourceDiscovery": "discovery",
+    "get_resource_discovery": "discovery",
+    "IncidentInvestigator": "workflows",
+    "IncidentType": "workflows",
+    "InvestigationResult": "workflows",
+    "InvestigationStep": "workflows",
+    "get_incident_investigator": "workflows",
+}
 
 __all__ = [
     # Environment comparison
@@ -84,3 +131,18 @@ __all__ = [
     "InvestigationStep",
     "get_incident_investigator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining a public name on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including ones not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,16 +3,74 @@
 Compare resources between LocalStack and production environments.
 """
 
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import itemgetter
+from typing import Any
 
 import boto3
 import structlog
+from botocore.config import Config
 
 from aws_sage.core.environment import EnvironmentConfig, EnvironmentType
+from aws_sage.core.serialization import dumps_json
 
 logger = structlog.get_logger()
 
+# Comparison clients make many calls in quick succession: keep connections
+# alive, leave room for every concurrent describe call without "connection
+# pool is full", and back off adaptively when throttled
+_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+
+def _queue_name_from_url(url: str) -> str:
+    """Extract the queue name from an SQS queue URL."""
+    # rpartition returns a fixed 3-tuple rather than building a split list
+    return url.rpartition("/")[2]
+
+
+def _topic_name(topic: dict) -> str:
+    """Extract the topic name from an SNS list_topics entry."""
+    return topic["TopicArn"].rpartition(":")[2]
+
+
+# Lambda configuration fields compared between environments, with their labels
+_LAMBDA_COMPARED_FIELDS = (
+    ("Runtime", "Runtime"),
+    ("MemorySize", "Memory"),
+    ("Timeout", "Timeout"),
+    ("Handler", "Handler"),
+)
+
+
+def _list_all(client: Any, operation: str, result_key: str, **params: Any) -> list:
+    """Collect a list operation's results across every page.
+
+    A single list call stops at the first page (100 tables, 50 functions,
+    1000 queues...), which would report the rest as missing.
+    """
+    pages = client.get_paginator(operation).paginate(**params)
+    return pages.build_full_result().get(result_key, [])
+
+
+async def _list_both(
+    source_client: Any, target_client: Any, operation: str, result_key: str, **params: Any
+) -> tuple[list, list]:
+    """List the same resources in both environments concurrently."""
+    source, target = await asyncio.gather(
+        asyncio.to_thread(_list_all, source_client, operation, result_key, **params),
+        asyncio.to_thread(_list_all, target_client, operation, result_key, **params),
+    )
+    return source, target
+
 
 class ResourceDifference(Enum):
     """Type of difference between environments."""
@@ -23,7 +81,7 @@ class ResourceDifference(Enum):
     IDENTICAL = "identical"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceComparison:
     """Comparison result for a single resource."""
 
@@ -46,7 +104,7 @@ class ResourceComparison:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Result of comparing two environments."""
 
@@ -57,11 +115,25 @@ class ComparisonResult:
     only_in_source: list[ResourceComparison] = field(default_factory=list)
     only_in_target: list[ResourceComparison] = field(default_factory=list)
     different: list[ResourceComparison] = field(default_factory=list)
-    identical: list[ResourceComparison] = field(default_factory=list)
+    # Only the number of identical resources is reported, so no per-resource
+    # objects are built for them
+    identical_count: int = 0
     errors: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        data = self.to_serializable()
+        for key in ("only_in_source", "only_in_target", "different"):
+            data[key] = [r.to_dict() for r in data[key]]
+        return data
+
+    def to_serializable(self) -> dict:
+        """Convert to a dictionary for JSON encoding.
+
+        Same shape as to_dict(), but resource entries stay ResourceComparison
+        dataclasses: orjson encodes those (and their enum) in C with the same
+        keys, instead of a Python dict being built per resource first.
+        """
         return {
             "service": self.service,
             "source_environment": self.source_environment,
@@ -71,37 +143,154 @@ class ComparisonResult:
                 "only_in_source": len(self.only_in_source),
                 "only_in_target": len(self.only_in_target),
                 "different": len(self.different),
-                "identical": len(self.identical),
+                "identical": self.identical_count,
             },
-            "only_in_source": [r.to_dict() for r in self.only_in_source],
-            "only_in_target": [r.to_dict() for r in self.only_in_target],
-            "different": [r.to_dict() for r in self.different],
-            "identical_count": len(self.identical),
+            "only_in_source": self.only_in_source,
+            "only_in_target": self.only_in_target,
+            "different": self.different,
+            "identical_count": self.identical_count,
             "errors": self.errors,
         }
 
+    def to_json(self) -> str:
+        """Convert to JSON string."""
+        return dumps_json(self.to_serializable())
+
+
+@dataclass(frozen=True, slots=True)
+class _ServiceSpec:
+    """How to list, name and compare one service's resources."""
+
+    resource_type: str
+    label: str
+    list_operation: str
+    result_key: str
+    name_of: Callable[[Any], str]
+    value_key: str
+    list_params: dict[str, Any] = field(default_factory=dict)
+    # Extra (output key, item field) pairs reported for resources only in source
+    source_fields: tuple[tuple[str, str], ...] = ()
+    # Fetches a shared resource's details; the listed item is used when None
+    describe: Callable[[Any, str], dict] | None = None
+    # Name of the EnvironmentComparer method comparing two resources' details;
+    # resources are matched by name only when None
+    config_diff: str | None = None
+
+
+# Dedicated pool for describe fan-out, created on first use. Keeps hundreds of
+# describe calls from queueing ahead of other tools' asyncio.to_thread work,
+# and caps the thread count below where GIL contention starts to dominate.
+_DESCRIBE_WORKERS = 16
+_describe_executor: ThreadPoolExecutor | None = None
+_describe_executor_lock = threading.Lock()
+
+
+def _get_describe_executor() -> ThreadPoolExecutor:
+    """Get the thread pool used for concurrent describe calls."""
+    global _describe_executor
+    executor = _describe_executor
+    if executor is None:
+        # Only the first callers take the lock; the pool is created once
+        with _describe_executor_lock:
+            executor = _describe_executor
+            if executor is None:
+                executor = _describe_executor = ThreadPoolExecutor(
+                    max_workers=_DESCRIBE_WORKERS, thread_name_prefix="aws-sage-compare"
+                )
+    return executor
+
+
+def _describe_table(client: Any, table: str) -> dict:
+    """Describe a DynamoDB table."""
+    return client.describe_table(TableName=table)["Table"]
+
+
+_SERVICE_SPECS: dict[str, _ServiceSpec] = {
+    "s3": _ServiceSpec(
+        resource_type="bucket",
+        label="S3 buckets",
+        list_operation="list_buckets",
+        result_key="Buckets",
+        name_of=itemgetter("Name"),
+        value_key="name",
+    ),
+    "dynamodb": _ServiceSpec(
+        resource_type="table",
+        label="DynamoDB tables",
+        list_operation="list_tables",
+        result_key="TableNames",
+        name_of=str,
+        value_key="table_name",
+        describe=_describe_table,
+        config_diff="_compare_table_schemas",
+    ),
+    "lambda": _ServiceSpec(
+        resource_type="function",
+        label="Lambda functions",
+        list_operation="list_functions",
+        result_key="Functions",
+        name_of=itemgetter("FunctionName"),
+        value_key="function_name",
+        source_fields=(("runtime", "Runtime"), ("memory", "MemorySize")),
+        config_diff="_compare_lambda_configs",
+    ),
+    "sqs": _ServiceSpec(
+        resource_type="queue",
+        label="SQS queues",
+        list_operation="list_queues",
+        result_key="QueueUrls",
+        name_of=_queue_name_from_url,
+        value_key="queue_name",
+        # SQS only returns a NextToken when a page size is requested
+        list_params={"PaginationConfig": {"PageSize": 1000}},
+    ),
+    "sns": _ServiceSpec(
+        resource_type="topic",
+        label="SNS topics",
+        list_operation="list_topics",
+        result_key="Topics",
+        name_of=_topic_name,
+        value_key="topic_name",
+    ),
+}
+
 
 class EnvironmentComparer:
     """Compare resources between AWS environments."""
 
     def __init__(self) -> None:
         """Initialize the comparer."""
-        self._supported_services = {
-            "s3": self._compare_s3_buckets,
-            "dynamodb": self._compare_dynamodb_tables,
-            "lambda": self._compare_lambda_functions,
-            "sqs": self._compare_sqs_queues,
-            "sns": self._compare_sns_topics,
-        }
+        self._clients: dict[tuple[Any, ...], Any] = {}
 
     @property
     def supported_services(self) -> list[str]:
         """Get list of supported services for comparison."""
-        return list(self._supported_services.keys())
+        return list(_SERVICE_SPECS)
 
-    def _get_client(self, service: str, env_config: EnvironmentConfig) -> boto3.client:
-        """Get boto3 client for an environment."""
-        kwargs = env_config.get_client_kwargs(service)
+    def _get_client(self, service: str, env_config: EnvironmentConfig) -> Any:
+        """Get boto3 client for an environment.
+
+        Clients are built once per service and environment settings and
+        reused for the lifetime of the comparer, keeping their connections.
+        """
+        key = (
+            service,
+            env_config.type,
+            env_config.endpoint_url,
+            env_config.region,
+            env_config.access_key_id,
+            env_config.secret_access_key,
+        )
+        client = self._clients.get(key)
+        if client is None:
+            client = self._create_client(service, env_config)
+            self._clients[key] = client
+        return client
+
+    def _create_client(self, service: str, env_config: EnvironmentConfig) -> Any:
+        """Create a boto3 client for an environment."""
+        # Memoized on the config, which hands out its own copy each call
+        kwargs: dict[str, Any] = env_config.get_client_kwargs(service)
 
         # Create session with appropriate credentials
         if env_config.type == EnvironmentType.LOCALSTACK:
@@ -113,7 +302,8 @@ class EnvironmentComparer:
         else:
             session = boto3.Session(region_name=env_config.region)
 
-        return session.client(service, **kwargs)
+        # The stubs only overload literal service names; ours come from _SERVICE_SPECS
+        return session.client(service, config=_CLIENT_CONFIG, **kwargs)  # type: ignore[call-overload]
 
     async def compare_environments(
         self,
@@ -131,7 +321,9 @@ class EnvironmentComparer:
         Returns:
             ComparisonResult with differences
         """
-        if service.lower() not in self._supported_services:
+        service_key = service.lower()
+        spec = _SERVICE_SPECS.get(service_key)
+        if spec is None:
             return ComparisonResult(
                 service=service,
                 source_environment=source_env.name,
@@ -143,160 +335,142 @@ class EnvironmentComparer:
                 ],
             )
 
-        compare_func = self._supported_services[service.lower()]
-        return await compare_func(source_env, target_env)
+        return await self._compare_service(service_key, spec, source_env, target_env)
 
-    async def _compare_s3_buckets(
-        self, source_env: EnvironmentConfig, target_env: EnvironmentConfig
+    async def _compare_service(
+        self,
+        service: str,
+        spec: _ServiceSpec,
+        source_env: EnvironmentConfig,
+        target_env: EnvironmentConfig,
     ) -> ComparisonResult:
-        """Compare S3 buckets between environments."""
+        """Compare one service's resources between environments."""
         result = ComparisonResult(
-            service="s3",
+            service=service,
             source_environment=source_env.name,
             target_environment=target_env.name,
-            resource_type="bucket",
+            resource_type=spec.resource_type,
         )
 
         try:
-            source_client = self._get_client("s3", source_env)
-            target_client = self._get_client("s3", target_env)
-
-            # Get buckets from both environments
-            source_response = source_client.list_buckets()
-            target_response = target_client.list_buckets()
-
-            source_buckets = {b["Name"]: b for b in source_response.get("Buckets", [])}
-            target_buckets = {b["Name"]: b for b in target_response.get("Buckets", [])}
-
-            # Find differences
-            for name, bucket in source_buckets.items():
-                if name not in target_buckets:
-                    result.only_in_source.append(
-                        ResourceComparison(
-                            resource_type="bucket",
-                            identifier=name,
-                            difference=ResourceDifference.ONLY_IN_SOURCE,
-                            source_value={"name": name},
-                        )
+            source_client = self._get_client(service, source_env)
+            target_client = self._get_client(service, target_env)
+
+            # Get resources from both environments, keyed by name
+            source_list, target_list = await _list_both(
+                source_client,
+                target_client,
+                spec.list_operation,
+                spec.result_key,
+                **spec.list_params,
+            )
+            # Only keep the listed items when their fields are reported or
+            # compared; otherwise the names alone are enough
+            if spec.source_fields or (spec.config_diff and spec.describe is None):
+                source_items = {spec.name_of(item): item for item in source_list}
+                target_items = {spec.name_of(item): item for item in target_list}
+            else:
+                source_items = dict.fromkeys(map(spec.name_of, source_list))
+                target_items = dict.fromkeys(map(spec.name_of, target_list))
+            del source_list, target_list
+
+            # Find differences with set operations instead of per-name lookups
+            for name in sorted(source_items.keys() - target_items.keys()):
+                item = source_items[name]
+                source_value = {spec.value_key: name}
+                for key, item_field in spec.source_fields:
+                    source_value[key] = item.get(item_field)
+                result.only_in_source.append(
+                    ResourceComparison(
+                        resource_type=spec.resource_type,
+                        identifier=name,
+                        difference=ResourceDifference.ONLY_IN_SOURCE,
+                        source_value=source_value,
                     )
+                )
+
+            shared = sorted(source_items.keys() & target_items.keys())
+            if spec.config_diff is None:
+                result.identical_count = len(shared)
+            else:
+                if spec.describe is None:
+                    details = [
+                        detail
+                        for name in shared
+                        for detail in (source_items[name], target_items[name])
+                    ]
                 else:
-                    result.identical.append(
-                        ResourceComparison(
-                            resource_type="bucket",
-                            identifier=name,
-                            difference=ResourceDifference.IDENTICAL,
-                        )
-                    )
-
-            for name in target_buckets:
-                if name not in source_buckets:
-                    result.only_in_target.append(
-                        ResourceComparison(
-                            resource_type="bucket",
-                            identifier=name,
-                            difference=ResourceDifference.ONLY_IN_TARGET,
-                            target_value={"name": name},
-                        )
-                    )
-
-        except Exception as e:
-            result.errors.append(f"Error comparing S3 buckets: {e!s}")
-            logger.error("s3_comparison_error", error=str(e))
-
-        return result
-
-    async def _compare_dynamodb_tables(
-        self, source_env: EnvironmentConfig, target_env: EnvironmentConfig
-    ) -> ComparisonResult:
-        """Compare DynamoDB tables between environments."""
-        result = ComparisonResult(
-            service="dynamodb",
-            source_environment=source_env.name,
-            target_environment=target_env.name,
-            resource_type="table",
-        )
-
-        try:
-            source_client = self._get_client("dynamodb", source_env)
-            target_client = self._get_client("dynamodb", target_env)
-
-            # Get tables from both environments
-            source_tables = set(source_client.list_tables().get("TableNames", []))
-            target_tables = set(target_client.list_tables().get("TableNames", []))
-
-            # Find differences
-            for table in source_tables:
-                if table not in target_tables:
-                    result.only_in_source.append(
-                        ResourceComparison(
-                            resource_type="table",
-                            identifier=table,
-                            difference=ResourceDifference.ONLY_IN_SOURCE,
-                            source_value={"table_name": table},
+                    # Describe every shared resource in both environments concurrently
+                    loop = asyncio.get_running_loop()
+                    executor = _get_describe_executor()
+                    details = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(executor, spec.describe, client, name)
+                            for name in shared
+                            for client in (source_client, target_client)
                         )
                     )
-                else:
-                    # Compare table schemas
-                    source_desc = source_client.describe_table(TableName=table)["Table"]
-                    target_desc = target_client.describe_table(TableName=table)["Table"]
 
-                    differences = self._compare_table_schemas(source_desc, target_desc)
+                compare_configs = getattr(self, spec.config_diff)
+                for index, name in enumerate(shared):
+                    differences = compare_configs(details[2 * index], details[2 * index + 1])
                     if differences:
                         result.different.append(
                             ResourceComparison(
-                                resource_type="table",
-                                identifier=table,
+                                resource_type=spec.resource_type,
+                                identifier=name,
                                 difference=ResourceDifference.DIFFERENT,
                                 differences=differences,
                             )
                         )
                     else:
-                        result.identical.append(
-                            ResourceComparison(
-                                resource_type="table",
-                                identifier=table,
-                                difference=ResourceDifference.IDENTICAL,
-                            )
-                        )
-
-            for table in target_tables:
-                if table not in source_tables:
-                    result.only_in_target.append(
-                        ResourceComparison(
-                            resource_type="table",
-                            identifier=table,
-                            difference=ResourceDifference.ONLY_IN_TARGET,
-                            target_value={"table_name": table},
-                        )
+                        result.identical_count += 1
+
+            for name in sorted(target_items.keys() - source_items.keys()):
+                result.only_in_target.append(
+                    ResourceComparison(
+                        resource_type=spec.resource_type,
+                        identifier=name,
+                        difference=ResourceDifference.ONLY_IN_TARGET,
+                        target_value={spec.value_key: name},
                     )
+                )
 
         except Exception as e:
-            result.errors.append(f"Error comparing DynamoDB tables: {e!s}")
-            logger.error("dynamodb_comparison_error", error=str(e))
+            result.errors.append(f"Error comparing {spec.label}: {e!s}")
+            logger.error(f"{service}_comparison_error", error=str(e))
 
         return result
 
     def _compare_table_schemas(self, source: dict, target: dict) -> list[str]:
-        """Compare DynamoDB table schemas."""
+        """Compare DynamoDB table schemas.
+
+        Matching schemas are settled by comparing the raw lists, which is
+        cheaper than building an order-insensitive fingerprint of each table;
+        descriptions are fetched fresh per comparison, so there is nothing
+        stable to memoize a fingerprint on either.
+        """
         differences = []
 
-        # Compare key schema
-        source_keys = {k["AttributeName"]: k["KeyType"] for k in source.get("KeySchema", [])}
-        target_keys = {k["AttributeName"]: k["KeyType"] for k in target.get("KeySchema", [])}
-        if source_keys != target_keys:
-            differences.append(f"Key schema differs: {source_keys} vs {target_keys}")
+        # Compare key schema (the raw lists are usually equal, so check that first)
+        source_schema = source.get("KeySchema", [])
+        target_schema = target.get("KeySchema", [])
+        if source_schema != target_schema:
+            source_keys = {k["AttributeName"]: k["KeyType"] for k in source_schema}
+            target_keys = {k["AttributeName"]: k["KeyType"] for k in target_schema}
+            if source_keys != target_keys:
+                differences.append(f"Key schema differs: {source_keys} vs {target_keys}")
 
         # Compare attribute definitions
-        source_attrs = {
-            a["AttributeName"]: a["AttributeType"]
-            for a in source.get("AttributeDefinitions", [])
-        }
-        target_attrs = {
-            a["AttributeName"]: a["AttributeType"]
-            for a in target.get("AttributeDefinitions", [])
-        }
-        if source_attrs != target_attrs:
-            differences.append(f"Attribute definitions differ: {source_attrs} vs {target_attrs}")
+        source_defs = source.get("AttributeDefinitions", [])
+        target_defs = target.get("AttributeDefinitions", [])
+        if source_defs != target_defs:
+            source_attrs = {a["AttributeName"]: a["AttributeType"] for a in source_defs}
+            target_attrs = {a["AttributeName"]: a["AttributeType"] for a in target_defs}
+            if source_attrs != target_attrs:
+                differences.append(
+                    f"Attribute definitions differ: {source_attrs} vs {target_attrs}"
+                )
 
         # Compare GSI count
         source_gsi = len(source.get("GlobalSecondaryIndexes", []))
@@ -306,235 +480,13 @@ class EnvironmentComparer:
 
         return differences
 
-    async def _compare_lambda_functions(
-        self, source_env: EnvironmentConfig, target_env: EnvironmentConfig
-    ) -> ComparisonResult:
-        """Compare Lambda functions between environments."""
-        result = ComparisonResult(
-            service="lambda",
-            source_environment=source_env.name,
-            target_environment=target_env.name,
-            resource_type="function",
-        )
-
-        try:
-            source_client = self._get_client("lambda", source_env)
-            target_client = self._get_client("lambda", target_env)
-
-            # Get functions from both environments
-            source_funcs = {
-                f["FunctionName"]: f
-                for f in source_client.list_functions().get("Functions", [])
-            }
-            target_funcs = {
-                f["FunctionName"]: f
-                for f in target_client.list_functions().get("Functions", [])
-            }
-
-            # Find differences
-            for name, func in source_funcs.items():
-                if name not in target_funcs:
-                    result.only_in_source.append(
-                        ResourceComparison(
-                            resource_type="function",
-                            identifier=name,
-                            difference=ResourceDifference.ONLY_IN_SOURCE,
-                            source_value={
-                                "function_name": name,
-                                "runtime": func.get("Runtime"),
-                                "memory": func.get("MemorySize"),
-                            },
-                        )
-                    )
-                else:
-                    # Compare function configs
-                    target_func = target_funcs[name]
-                    differences = self._compare_lambda_configs(func, target_func)
-                    if differences:
-                        result.different.append(
-                            ResourceComparison(
-                                resource_type="function",
-                                identifier=name,
-                                difference=ResourceDifference.DIFFERENT,
-                                differences=differences,
-                            )
-                        )
-                    else:
-                        result.identical.append(
-                            ResourceComparison(
-                                resource_type="function",
-                                identifier=name,
-                                difference=ResourceDifference.IDENTICAL,
-                            )
-                        )
-
-            for name in target_funcs:
-                if name not in source_funcs:
-                    result.only_in_target.append(
-                        ResourceComparison(
-                            resource_type="function",
-                            identifier=name,
-                            difference=ResourceDifference.ONLY_IN_TARGET,
-                            target_value={"function_name": name},
-                        )
-                    )
-
-        except Exception as e:
-            result.errors.append(f"Error comparing Lambda functions: {e!s}")
-            logger.error("lambda_comparison_error", error=str(e))
-
-        return result
-
     def _compare_lambda_configs(self, source: dict, target: dict) -> list[str]:
         """Compare Lambda function configurations."""
-        differences = []
-
-        if source.get("Runtime") != target.get("Runtime"):
-            differences.append(
-                f"Runtime differs: {source.get('Runtime')} vs {target.get('Runtime')}"
-            )
-
-        if source.get("MemorySize") != target.get("MemorySize"):
-            differences.append(
-                f"Memory differs: {source.get('MemorySize')} vs {target.get('MemorySize')}"
-            )
-
-        if source.get("Timeout") != target.get("Timeout"):
-            differences.append(
-                f"Timeout differs: {source.get('Timeout')} vs {target.get('Timeout')}"
-            )
-
-        if source.get("Handler") != target.get("Handler"):
-            differences.append(
-                f"Handler differs: {source.get('Handler')} vs {target.get('Handler')}"
-            )
-
-        return differences
-
-    async def _compare_sqs_queues(
-        self, source_env: EnvironmentConfig, target_env: EnvironmentConfig
-    ) -> ComparisonResult:
-        """Compare SQS queues between environments."""
-        result = ComparisonResult(
-            service="sqs",
-            source_environment=source_env.name,
-            target_environment=target_env.name,
-            resource_type="queue",
-        )
-
-        try:
-            source_client = self._get_client("sqs", source_env)
-            target_client = self._get_client("sqs", target_env)
-
-            # Get queues from both environments
-            source_queues = set(source_client.list_queues().get("QueueUrls", []))
-            target_queues = set(target_client.list_queues().get("QueueUrls", []))
-
-            # Extract queue names from URLs
-            def get_queue_name(url: str) -> str:
-                return url.split("/")[-1]
-
-            source_names = {get_queue_name(q): q for q in source_queues}
-            target_names = {get_queue_name(q): q for q in target_queues}
-
-            # Find differences
-            for name in source_names:
-                if name not in target_names:
-                    result.only_in_source.append(
-                        ResourceComparison(
-                            resource_type="queue",
-                            identifier=name,
-                            difference=ResourceDifference.ONLY_IN_SOURCE,
-                            source_value={"queue_name": name},
-                        )
-                    )
-                else:
-                    result.identical.append(
-                        ResourceComparison(
-                            resource_type="queue",
-                            identifier=name,
-                            difference=ResourceDifference.IDENTICAL,
-                        )
-                    )
-
-            for name in target_names:
-                if name not in source_names:
-                    result.only_in_target.append(
-                        ResourceComparison(
-                            resource_type="queue",
-                            identifier=name,
-                            difference=ResourceDifference.ONLY_IN_TARGET,
-                            target_value={"queue_name": name},
-                        )
-                    )
-
-        except Exception as e:
-            result.errors.append(f"Error comparing SQS queues: {e!s}")
-            logger.error("sqs_comparison_error", error=str(e))
-
-        return result
-
-    async def _compare_sns_topics(
-        self, source_env: EnvironmentConfig, target_env: EnvironmentConfig
-    ) -> ComparisonResult:
-        """Compare SNS topics between environments."""
-        result = ComparisonResult(
-            service="sns",
-            source_environment=source_env.name,
-            target_environment=target_env.name,
-            resource_type="topic",
-        )
-
-        try:
-            source_client = self._get_client("sns", source_env)
-            target_client = self._get_client("sns", target_env)
-
-            # Get topics from both environments
-            source_topics = {
-                t["TopicArn"].split(":")[-1]: t["TopicArn"]
-                for t in source_client.list_topics().get("Topics", [])
-            }
-            target_topics = {
-                t["TopicArn"].split(":")[-1]: t["TopicArn"]
-                for t in target_client.list_topics().get("Topics", [])
-            }
-
-            # Find differences
-            for name in source_topics:
-                if name not in target_topics:
-                    result.only_in_source.append(
-                        ResourceComparison(
-                            resource_type="topic",
-                            identifier=name,
-                            difference=ResourceDifference.ONLY_IN_SOURCE,
-                            source_value={"topic_name": name},
-                        )
-                    )
-                else:
-                    result.identical.append(
-                        ResourceComparison(
-                            resource_type="topic",
-                            identifier=name,
-                            difference=ResourceDifference.IDENTICAL,
-                        )
-                    )
-
-            for name in target_topics:
-                if name not in source_topics:
-                    result.only_in_target.append(
-                        ResourceComparison(
-                            resource_type="topic",
-                            identifier=name,
-                            difference=ResourceDifference.ONLY_IN_TARGET,
-                            target_value={"topic_name": name},
-                        )
-                    )
-
-        except Exception as e:
-            result.errors.append(f"Error comparing SNS topics: {e!s}")
-            logger.error("sns_comparison_error", error=str(e))
-
-        return result
+        return [
+            f"{label} differs: {source.get(key)} vs {target.get(key)}"
+            for key, label in _LAMBDA_COMPARED_FIELDS
+            if source.get(key) != target.get(key)
+        ]
 
 
 # Global instance
@@ -550,6 +502,14 @@ def get_environment_comparer() -> EnvironmentComparer:
 
 
 def reset_environment_comparer() -> None:
-    """Reset the global EnvironmentComparer instance (for testing)."""
-    global _comparer
+    """Reset the global EnvironmentComparer instance (for testing).
+
+    Also shuts down the describe thread pool; the next comparison creates a
+    new one.
+    """
+    global _comparer, _describe_executor
     _comparer = None
+    with _describe_executor_lock:
+        executor, _describe_executor = _describe_executor, None
+    if executor is not None:
+        executor.shutdown()
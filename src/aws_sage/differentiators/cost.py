@@ -15,6 +15,11 @@ from aws_sage.core.session import get_session_manager
 logger = structlog.get_logger()
 
 
+def _get_name_tag(resource: dict[str, Any]) -> str | None:
+    """Return the value of a resource's Name tag, if present."""
+    return next((tag["Value"] for tag in resource.get("Tags", ()) if tag["Key"] == "Name"), None)
+
+
 # === Enums ===
 
 
@@ -309,15 +314,11 @@ class CostAnalyzer:
         errors: list[str] = []
 
         for service in services_to_check:
+            detector = self._IDLE_DETECTORS.get(service)
+            if detector is None:
+                continue
             try:
-                if service == "ec2":
-                    idle_resources.extend(await self._find_idle_ec2_instances(region, lookback_days))
-                elif service == "rds":
-                    idle_resources.extend(await self._find_idle_rds_instances(region, lookback_days))
-                elif service == "ebs":
-                    idle_resources.extend(await self._find_idle_ebs_volumes(region))
-                elif service == "eip":
-                    idle_resources.extend(await self._find_unused_elastic_ips(region))
+                idle_resources.extend(await detector(self, region, lookback_days))
             except Exception as e:
                 logger.warning("idle_detection_failed", service=service, error=str(e))
                 errors.append(f"{service}: {str(e)}")
@@ -349,11 +350,7 @@ class CostAnalyzer:
                     state = instance["State"]["Name"]
                     instance_type = instance["InstanceType"]
 
-                    name = None
-                    for tag in instance.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
+                    name = _get_name_tag(instance)
 
                     arn = f"arn:aws:ec2:{effective_region}:{account_info.account_id}:instance/{instance_id}"
 
@@ -470,8 +467,14 @@ class CostAnalyzer:
 
         return idle
 
-    async def _find_idle_ebs_volumes(self, region: str | None) -> list[IdleResource]:
-        """Find unattached EBS volumes."""
+    async def _find_idle_ebs_volumes(
+        self, region: str | None, lookback_days: int
+    ) -> list[IdleResource]:
+        """Find unattached EBS volumes.
+
+        lookback_days is unused; it keeps the signature shared with the other
+        idle detectors.
+        """
         idle: list[IdleResource] = []
         ec2 = self.session_mgr.get_client("ec2", region)
         account_info = self.session_mgr.get_account_info()
@@ -486,11 +489,7 @@ class CostAnalyzer:
                 size_gb = volume["Size"]
                 volume_type = volume["VolumeType"]
 
-                name = None
-                for tag in volume.get("Tags", []):
-                    if tag["Key"] == "Name":
-                        name = tag["Value"]
-                        break
+                name = _get_name_tag(volume)
 
                 arn = f"arn:aws:ec2:{effective_region}:{account_info.account_id}:volume/{volume_id}"
 
@@ -510,8 +509,14 @@ class CostAnalyzer:
 
         return idle
 
-    async def _find_unused_elastic_ips(self, region: str | None) -> list[IdleResource]:
-        """Find unassociated Elastic IPs."""
+    async def _find_unused_elastic_ips(
+        self, region: str | None, lookback_days: int
+    ) -> list[IdleResource]:
+        """Find unassociated Elastic IPs.
+
+        lookback_days is unused; it keeps the signature shared with the other
+        idle detectors.
+        """
         idle: list[IdleResource] = []
         ec2 = self.session_mgr.get_client("ec2", region)
         account_info = self.session_mgr.get_account_info()
@@ -542,6 +547,14 @@ class CostAnalyzer:
 
         return idle
 
+    # Idle detectors by service; each is called as detector(self, region, lookback_days)
+    _IDLE_DETECTORS = {
+        "ec2": _find_idle_ec2_instances,
+        "rds": _find_idle_rds_instances,
+        "ebs": _find_idle_ebs_volumes,
+        "eip": _find_unused_elastic_ips,
+    }
+
     # === Right-Sizing Recommendations ===
 
     async def get_rightsizing_recommendations(
@@ -595,11 +608,7 @@ class CostAnalyzer:
                     instance_id = instance["InstanceId"]
                     instance_type = instance["InstanceType"]
 
-                    name = None
-                    for tag in instance.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
+                    name = _get_name_tag(instance)
 
                     arn = f"arn:aws:ec2:{effective_region}:{account_info.account_id}:instance/{instance_id}"
 
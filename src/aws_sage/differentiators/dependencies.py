@@ -149,17 +149,12 @@ class DependencyMapper:
         """Get dependencies for a specific service type."""
         dependencies: list[ResourceDependency] = []
 
+        handler = self._DEPENDENCY_HANDLERS.get(service)
+        if handler is None:
+            return dependencies
+
         try:
-            if service == "lambda":
-                dependencies.extend(await self._get_lambda_dependencies(resource_arn, region))
-            elif service == "ec2":
-                dependencies.extend(await self._get_ec2_dependencies(resource_arn, region))
-            elif service == "rds":
-                dependencies.extend(await self._get_rds_dependencies(resource_arn, region))
-            elif service == "ecs":
-                dependencies.extend(await self._get_ecs_dependencies(resource_arn, region))
-            elif service == "elasticloadbalancing":
-                dependencies.extend(await self._get_elb_dependencies(resource_arn, region))
+            dependencies.extend(await handler(self, resource_arn, region))
         except Exception as e:
             logger.warning("failed_to_get_dependencies", service=service, error=str(e))
 
@@ -480,6 +475,15 @@ class DependencyMapper:
 
         return dependencies
 
+    # Dependency handlers by ARN service; each is called as handler(self, arn, region)
+    _DEPENDENCY_HANDLERS = {
+        "lambda": _get_lambda_dependencies,
+        "ec2": _get_ec2_dependencies,
+        "rds": _get_rds_dependencies,
+        "ecs": _get_ecs_dependencies,
+        "elasticloadbalancing": _get_elb_dependencies,
+    }
+
     async def impact_analysis(
         self,
         resource_arn: str,
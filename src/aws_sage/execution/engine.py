@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import itertools
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -13,9 +14,10 @@ from botocore.exceptions import ClientError, ParamValidationError
 from aws_sage.config import OperationCategory, get_config
 from aws_sage.core.context import get_context
 from aws_sage.core.exceptions import AWSMCPError, SafetyError
+from aws_sage.core.serialization import dumps_json, dumps_ndjson
 from aws_sage.core.session import SessionManager, get_session_manager
 from aws_sage.execution.errors import ErrorHandler
-from aws_sage.execution.pagination import PaginationHandler
+from aws_sage.execution.pagination import AsyncPaginationHandler
 from aws_sage.parser.intent import get_intent_classifier
 from aws_sage.parser.schemas import ParseResult, StructuredCommand
 from aws_sage.parser.service_models import get_service_registry
@@ -24,6 +26,23 @@ from aws_sage.safety.validator import SafetyDecision, get_safety_enforcer
 
 logger = structlog.get_logger()
 
+# Leaf types that pass through cleaning unchanged
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _clean_value(data: Any) -> Any:
+    """Drop ResponseMetadata and convert datetimes to ISO strings, recursively."""
+    # Leaves make up most of a large response, so check them by exact type first
+    if type(data) in _PASSTHROUGH_TYPES:
+        return data
+    if isinstance(data, dict):
+        return {k: _clean_value(v) for k, v in data.items() if k != "ResponseMetadata"}
+    if isinstance(data, list):
+        return [_clean_value(item) for item in data]
+    if isinstance(data, datetime) or hasattr(data, "isoformat"):
+        return data.isoformat()
+    return data
+
 
 @dataclass
 class ExecutionResult:
@@ -87,7 +106,21 @@ class ExecutionResult:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        return dumps_json(self.to_dict())
+
+    def to_ndjson(self) -> str:
+        """Convert to newline-delimited JSON.
+
+        List results become a summary line followed by one line per item;
+        anything else is emitted as a single line.
+        """
+        result = self.to_dict()
+        if not isinstance(result.get("data"), list):
+            return dumps_ndjson([result])
+
+        items = result.pop("data")
+        result.pop("formatted_table", None)
+        return dumps_ndjson(itertools.chain([result], items))
 
 
 class ExecutionEngine:
@@ -102,7 +135,7 @@ class ExecutionEngine:
         self.intent_classifier = get_intent_classifier()
         self.service_registry = get_service_registry()
         self.safety_enforcer = get_safety_enforcer()
-        self.pagination_handler = PaginationHandler()
+        self.pagination_handler = AsyncPaginationHandler()
         self.error_handler = ErrorHandler()
 
     async def execute_natural_language(
@@ -110,6 +143,7 @@ class ExecutionEngine:
         query: str,
         region: str | None = None,
         confirm: bool = False,
+        build_table: bool = True,
     ) -> ExecutionResult:
         """
         Execute a natural language query.
@@ -120,6 +154,7 @@ class ExecutionEngine:
             query: Natural language query
             region: Target region (optional)
             confirm: Whether user has confirmed the operation
+            build_table: Whether to render list results as a text table
 
         Returns:
             ExecutionResult with data or error
@@ -156,12 +191,13 @@ class ExecutionEngine:
             command.region = region
 
         # Execute the command
-        return await self.execute_command(command, confirm=confirm)
+        return await self.execute_command(command, confirm=confirm, build_table=build_table)
 
     async def execute_command(
         self,
         command: StructuredCommand,
         confirm: bool = False,
+        build_table: bool = True,
     ) -> ExecutionResult:
         """
         Execute a structured command.
@@ -169,6 +205,7 @@ class ExecutionEngine:
         Args:
             command: Parsed and validated command
             confirm: Whether user has confirmed the operation
+            build_table: Whether to render list results as a text table
 
         Returns:
             ExecutionResult with data or error
@@ -243,8 +280,10 @@ class ExecutionEngine:
                 command.operation,
             )
 
+            # boto3 calls block, so run them in a worker thread to keep the
+            # event loop free for other tool calls while AWS responds
             if supports_pagination:
-                data, truncated = self.pagination_handler.execute_paginated(
+                data, truncated = await self.pagination_handler.execute_paginated(
                     client,
                     command.operation,
                     command.parameters,
@@ -252,7 +291,7 @@ class ExecutionEngine:
                 )
             else:
                 method = getattr(client, command.operation)
-                response = method(**command.parameters)
+                response = await asyncio.to_thread(method, **command.parameters)
                 data = self._extract_data(response, result_key)
                 truncated = False
 
@@ -264,7 +303,8 @@ class ExecutionEngine:
             count = None
             if isinstance(data, list):
                 count = len(data)
-                formatted_table = self._format_as_table(data)
+                if build_table and get_config().format_tables:
+                    formatted_table = self._format_as_table(data)
 
                 # Record resources in context
                 context = get_context()
@@ -400,19 +440,7 @@ class ExecutionEngine:
 
     def _clean_response(self, data: Any) -> Any:
         """Clean response data for serialization."""
-        if isinstance(data, dict):
-            return {
-                k: self._clean_response(v)
-                for k, v in data.items()
-                if k != "ResponseMetadata"
-            }
-        elif isinstance(data, list):
-            return [self._clean_response(item) for item in data]
-        elif isinstance(data, datetime):
-            return data.isoformat()
-        elif hasattr(data, "isoformat"):
-            return data.isoformat()
-        return data
+        return _clean_value(data)
 
     def _format_as_table(self, data: list[dict[str, Any]]) -> str | None:
         """Format data as markdown table."""
@@ -423,25 +451,22 @@ class ExecutionEngine:
         all_headers = list(data[0].keys())
         headers = all_headers[:6]
 
-        # Calculate column widths
-        col_widths = [min(30, len(h)) for h in headers]
-        for row in data[:20]:  # Sample first 20 rows
-            for i, h in enumerate(headers):
-                if h in row:
-                    val = str(row[h])[:30]
-                    col_widths[i] = min(30, max(col_widths[i], len(val)))
+        # Stringify the rendered rows once; widths are sampled from the first 20
+        rows = [[str(row.get(h, ""))[:30] for h in headers] for row in data[:50]]
+        col_widths = [
+            min(30, max([len(h)] + [len(cells[i]) for cells in rows[:20]]))
+            for i, h in enumerate(headers)
+        ]
 
         # Build table
-        lines = []
-        lines.append("| " + " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers)) + " |")
-        lines.append("| " + " | ".join("-" * w for w in col_widths) + " |")
-
-        for row in data[:50]:  # Limit to 50 rows
-            cells = [
-                str(row.get(h, ""))[:30].ljust(col_widths[i])
-                for i, h in enumerate(headers)
-            ]
-            lines.append("| " + " | ".join(cells) + " |")
+        lines = [
+            "| " + " | ".join(h.ljust(w) for h, w in zip(headers, col_widths, strict=True)) + " |",
+            "| " + " | ".join("-" * w for w in col_widths) + " |",
+        ]
+        lines.extend(
+            "| " + " | ".join(c.ljust(w) for c, w in zip(cells, col_widths, strict=True)) + " |"
+            for cells in rows
+        )
 
         if len(data) > 50:
             lines.append(f"... and {len(data) - 50} more rows")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, AsyncIterator
 
 import structlog
@@ -53,9 +54,9 @@ class PaginationHandler:
 
     def _supports_pagination(self, client: Any, operation: str) -> bool:
         """Check if an operation supports pagination."""
+        # can_paginate is a model lookup; get_paginator builds a paginator object
         try:
-            client.get_paginator(operation)
-            return True
+            return bool(client.can_paginate(operation))
         except Exception:
             return False
 
@@ -182,8 +183,6 @@ class AsyncPaginationHandler:
         This wraps the sync pagination in an async context.
         For true async, use aioboto3.
         """
-        import asyncio
-
         handler = PaginationHandler(self.max_pages, self.max_items)
         return await asyncio.to_thread(
             handler.execute_paginated,
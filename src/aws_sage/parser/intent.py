@@ -21,6 +21,10 @@ from aws_sage.parser.schemas import (
 
 logger = structlog.get_logger()
 
+# Words that imply a list intent when no intent pattern matches
+_FALLBACK_INTENT_WORDS = frozenset({"list", "show", "get", "all"})
+_TOKEN_REGEX = re.compile(r"[a-z0-9]+")
+
 
 @dataclass
 class IntentPattern:
@@ -304,15 +308,20 @@ class IntentClassifier:
 
     def __init__(self) -> None:
         """Initialize the intent classifier."""
-        self._compiled_patterns: dict[str, list[re.Pattern[str]]] = {}
-        self._compile_patterns()
+        self._intent_regex: re.Pattern[str] = self._compile_patterns()
+
+    def _compile_patterns(self) -> re.Pattern[str]:
+        """Pre-compile all intent patterns into a single alternation.
 
-    def _compile_patterns(self) -> None:
-        """Pre-compile regex patterns for performance."""
-        for intent_pattern in self.INTENT_PATTERNS:
-            self._compiled_patterns[intent_pattern.intent_type] = [
-                re.compile(p, re.IGNORECASE) for p in intent_pattern.patterns
-            ]
+        Each intent becomes a named group and alternatives keep their
+        declaration order, so one search gives the same first match as
+        trying the patterns one by one.
+        """
+        groups = [
+            f"(?P<{intent_pattern.intent_type}>" + "|".join(intent_pattern.patterns) + ")"
+            for intent_pattern in self.INTENT_PATTERNS
+        ]
+        return re.compile("|".join(groups), re.IGNORECASE)
 
     def classify(self, query: str) -> ParseResult:
         """
@@ -330,8 +339,12 @@ class IntentClassifier:
 
         logger.debug("classifying_query", query=query)
 
+        # Lowercase and tokenize once; every step below matches against these
+        query_lower = query.lower()
+        query_tokens = frozenset(_TOKEN_REGEX.findall(query_lower))
+
         # Step 1: Classify intent
-        intent = self._classify_intent(query)
+        intent = self._classify_intent(query, query_lower, query_tokens)
         if not intent:
             return ParseResult.error_result(
                 "Could not understand the intent. Try phrases like 'list buckets' or 'describe instances'.",
@@ -339,7 +352,7 @@ class IntentClassifier:
             )
 
         # Step 2: Identify service
-        service = self._identify_service(query)
+        service = self._identify_service(query_lower, query_tokens)
         if not service:
             return ParseResult.error_result(
                 "Could not identify the AWS service. Please specify a service like S3, EC2, or Lambda.",
@@ -347,10 +360,12 @@ class IntentClassifier:
             )
 
         # Step 3: Determine operation
-        operation = self._determine_operation(intent, service, query)
+        operation = self._determine_operation(intent, service, query_lower)
 
         # Step 4: Extract parameters
-        parameters = self._extract_parameters(query, service.service_name, operation.operation_name)
+        parameters = self._extract_parameters(
+            query_lower, service.service_name, operation.operation_name
+        )
 
         # Step 5: Build structured command
         command = StructuredCommand(
@@ -377,28 +392,34 @@ class IntentClassifier:
             parameters=parameters,
         )
 
-    def _classify_intent(self, query: str) -> ParsedIntent | None:
+    def _classify_intent(
+        self, query: str, query_lower: str, query_tokens: frozenset[str]
+    ) -> ParsedIntent | None:
         """Classify the user's intent from the query."""
-        query_lower = query.lower()
-
-        for intent_pattern in self.INTENT_PATTERNS:
-            for pattern in self._compiled_patterns[intent_pattern.intent_type]:
-                if pattern.search(query_lower):
-                    return ParsedIntent(
-                        intent_type=intent_pattern.intent_type,
-                        confidence=0.9,
-                        raw_input=query,
-                    )
+        match = self._intent_regex.search(query_lower)
+        if match:
+            # Every alternative in the combined regex is a named group
+            assert match.lastgroup is not None
+            return ParsedIntent(
+                intent_type=match.lastgroup,
+                confidence=0.9,
+                raw_input=query,
+            )
 
         # Fallback: check for simple keyword presence
-        if any(word in query_lower for word in ["list", "show", "get", "all"]):
+        if not _FALLBACK_INTENT_WORDS.isdisjoint(query_tokens):
             return ParsedIntent(intent_type="list", confidence=0.6, raw_input=query)
 
         return None
 
-    def _identify_service(self, query: str) -> ParsedService | None:
-        """Identify the AWS service from the query."""
-        query_lower = query.lower()
+    def _identify_service(
+        self, query_lower: str, query_tokens: frozenset[str]
+    ) -> ParsedService | None:
+        """Identify the AWS service from the lowercased query.
+
+        Keywords match as substrings (so plurals and multi-word keywords work);
+        the service name bonus requires the name as a whole token.
+        """
         best_match: ParsedService | None = None
         best_score = 0.0
 
@@ -412,7 +433,7 @@ class IntentClassifier:
                 # Score based on keyword matches and specificity
                 score = len(matched_keywords) / len(service_info["keywords"])
                 # Bonus for exact service name match
-                if service_name in query_lower:
+                if service_name in query_tokens:
                     score += 0.3
 
                 if score > best_score:
@@ -430,12 +451,11 @@ class IntentClassifier:
         self,
         intent: ParsedIntent,
         service: ParsedService,
-        query: str,
+        query_lower: str,
     ) -> ParsedOperation:
         """Determine the specific AWS operation to call."""
         from aws_sage.safety.classifier import OperationClassifier
 
-        query_lower = query.lower()
         service_info = self.SERVICE_KEYWORDS.get(service.service_name, {})
         resource_types = service_info.get("resource_types", {})
 
@@ -473,13 +493,12 @@ class IntentClassifier:
 
     def _extract_parameters(
         self,
-        query: str,
+        query_lower: str,
         service: str,
         operation: str,
     ) -> list[ParsedParameter]:
-        """Extract parameters from the query."""
+        """Extract parameters from the lowercased query."""
         parameters: list[ParsedParameter] = []
-        query_lower = query.lower()
 
         # Extract common patterns
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from functools import lru_cache
 from typing import Any
 
@@ -13,6 +14,9 @@ from aws_sage.parser.schemas import ValidationResult
 
 logger = structlog.get_logger()
 
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+
 
 class ServiceModelRegistry:
     """Registry for AWS service models using botocore."""
@@ -216,9 +220,8 @@ class ServiceModelRegistry:
     @staticmethod
     def _to_snake_case(name: str) -> str:
         """Convert PascalCase to snake_case."""
-        import re
-        s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-        return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+        s1 = _CAMEL_WORD_RE.sub(r"\1_\2", name)
+        return _CAMEL_BOUNDARY_RE.sub(r"\1_\2", s1).lower()
 
     def supports_pagination(self, service: str, operation: str) -> bool:
         """Check if an operation supports pagination."""
@@ -4,10 +4,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import re
 import sys
-from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 import structlog
 from fastmcp import FastMCP
@@ -19,7 +18,9 @@ from aws_sage.core.exceptions import (
     AWSMCPError,
     AuthenticationError,
     SafetyError,
+    ValidationError,
 )
+from aws_sage.core.serialization import dumps_json, dumps_log_json
 from aws_sage.core.session import get_session_manager
 from aws_sage.core.environment_manager import get_environment_manager
 from aws_sage.core.multi_account import get_multi_account_manager
@@ -42,11 +43,12 @@ structlog.configure(
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=dumps_log_json),
     ],
     wrapper_class=structlog.stdlib.BoundLogger,
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
+    cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger()
@@ -143,44 +145,27 @@ def format_as_table(data: list[dict[str, Any]], headers: list[str] | None = None
         headers = list(data[0].keys())
 
     if not headers:
-        return json.dumps(data, indent=2, default=str)
+        return dumps_json(data)
 
-    # Calculate column widths (max 40 chars)
-    col_widths = [min(40, len(h)) for h in headers]
-    for row in data:
-        for i, h in enumerate(headers):
-            if isinstance(row, dict) and h in row:
-                val = str(row[h])[:40]
-                col_widths[i] = min(40, max(col_widths[i], len(val)))
+    # Stringify each cell once and derive the column widths (max 40 chars) from it
+    rows = [[str(row.get(h, ""))[:40] for h in headers] for row in data if isinstance(row, dict)]
+    col_widths = [
+        min(40, max([len(h)] + [len(cells[i]) for cells in rows])) for i, h in enumerate(headers)
+    ]
 
     # Build table
-    lines = []
-    lines.append("| " + " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers)) + " |")
-    lines.append("| " + " | ".join("-" * w for w in col_widths) + " |")
-
-    for row in data:
-        if isinstance(row, dict):
-            cells = [str(row.get(h, ""))[:40].ljust(col_widths[i]) for i, h in enumerate(headers)]
-            lines.append("| " + " | ".join(cells) + " |")
+    lines = [
+        "| " + " | ".join(h.ljust(w) for h, w in zip(headers, col_widths, strict=True)) + " |",
+        "| " + " | ".join("-" * w for w in col_widths) + " |",
+    ]
+    lines.extend(
+        "| " + " | ".join(c.ljust(w) for c, w in zip(cells, col_widths, strict=True)) + " |"
+        for cells in rows
+    )
 
     return "\n".join(lines)
 
 
-def clean_response(obj: Any) -> Any:
-    """Clean AWS response for JSON serialization."""
-    if isinstance(obj, dict):
-        # Remove ResponseMetadata
-        cleaned = {k: clean_response(v) for k, v in obj.items() if k != "ResponseMetadata"}
-        return cleaned
-    elif isinstance(obj, list):
-        return [clean_response(i) for i in obj]
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
-    elif hasattr(obj, "isoformat"):
-        return obj.isoformat()
-    return obj
-
-
 def make_response(
     status: str,
     data: Any = None,
@@ -192,9 +177,15 @@ def make_response(
     if message:
         response["message"] = message
     if data is not None:
-        response["data"] = clean_response(data)
+        # Datetimes are encoded during the dump instead of copying the tree first
+        if isinstance(data, dict) and "ResponseMetadata" in data:
+            data = {k: v for k, v in data.items() if k != "ResponseMetadata"}
+        response["data"] = data
+    # Tables are omitted entirely when table formatting is disabled
+    if kwargs.get("formatted_table") is None:
+        kwargs.pop("formatted_table", None)
     response.update(kwargs)
-    return json.dumps(response, indent=2, default=str)
+    return dumps_json(response)
 
 
 # === Core Tools ===
@@ -213,7 +204,7 @@ async def list_profiles() -> str:
                 message="No AWS profiles found. Run 'aws configure' to set up credentials.",
             )
 
-        table = format_as_table(profiles, ["name", "type"])
+        table = format_as_table(profiles, ["name", "type"]) if get_config().format_tables else None
         return make_response(
             "success",
             data=profiles,
@@ -230,7 +221,8 @@ async def select_profile(profile: str, region: str | None = None) -> str:
     """Select an AWS profile and validate credentials."""
     try:
         session_mgr = get_session_manager()
-        account_info = session_mgr.select_profile(profile, region)
+        # STS validation is a blocking network call; keep the event loop free
+        account_info = await asyncio.to_thread(session_mgr.select_profile, profile, region)
 
         return make_response(
             "success",
@@ -254,7 +246,7 @@ async def get_account_info() -> str:
     """Get information about the current AWS session."""
     try:
         session_mgr = get_session_manager()
-        account_info = session_mgr.get_account_info()
+        account_info = await asyncio.to_thread(session_mgr.get_account_info)
         safety = get_safety_enforcer()
 
         data = {
@@ -318,6 +310,7 @@ async def aws_query(
     query: str,
     service: str | None = None,
     region: str | None = None,
+    output_format: Literal["json", "ndjson"] = "json",
 ) -> str:
     """Execute a read-only AWS query.
 
@@ -325,11 +318,27 @@ async def aws_query(
     - "list all S3 buckets"
     - "show EC2 instances"
     - "get Lambda functions"
+
+    Set output_format="ndjson" to get a summary line followed by one JSON
+    line per result item, which suits large listings.
     """
     try:
         # Use the execution engine for natural language queries
+        if output_format not in ("json", "ndjson"):
+            raise ValidationError(
+                f"Invalid output_format '{output_format}'",
+                field="output_format",
+                expected="json or ndjson",
+                received=output_format,
+            )
+
+        # NDJSON drops the rendered table, so don't spend time building it
         engine = get_execution_engine()
-        result = await engine.execute_natural_language(query, region=region)
+        result = await engine.execute_natural_language(
+            query, region=region, build_table=output_format == "json"
+        )
+        if output_format == "ndjson":
+            return result.to_ndjson()
         return result.to_json()
 
     except AWSMCPError as e:
@@ -440,7 +449,7 @@ async def list_aliases() -> str:
         return make_response("success", data=[], message="No aliases defined.")
 
     alias_list = [{"name": k, "value": v} for k, v in aliases.items()]
-    table = format_as_table(alias_list, ["name", "value"])
+    table = format_as_table(alias_list, ["name", "value"]) if get_config().format_tables else None
     return make_response(
         "success",
         data=alias_list,
@@ -515,11 +524,13 @@ async def discover_resources(
             )
 
         # Format as table
-        table_data = [
-            {"service": r["service"], "type": r["type"], "arn": r["arn"][:60] + "..."}
-            for r in resources
-        ]
-        table = format_as_table(table_data, ["service", "type", "arn"])
+        table = None
+        if get_config().format_tables:
+            table_data = [
+                {"service": r["service"], "type": r["type"], "arn": r["arn"][:60] + "..."}
+                for r in resources
+            ]
+            table = format_as_table(table_data, ["service", "type", "arn"])
 
         return make_response(
             "success",
@@ -1142,18 +1153,18 @@ async def compare_environments(
         if result.errors:
             return make_response(
                 "warning",
-                data=result.to_dict(),
+                data=result.to_serializable(),
                 message="Comparison completed with errors",
             )
 
         return make_response(
             "success",
-            data=result.to_dict(),
+            data=result.to_serializable(),
             summary={
                 "only_in_source": len(result.only_in_source),
                 "only_in_target": len(result.only_in_target),
                 "different": len(result.different),
-                "identical": len(result.identical),
+                "identical": result.identical_count,
             },
         )
     except Exception as e:
@@ -1198,7 +1209,8 @@ async def assume_role(
     """
     try:
         manager = get_multi_account_manager()
-        result = manager.assume_role(
+        result = await asyncio.to_thread(
+            manager.assume_role,
             role_arn=role_arn,
             session_name=session_name,
             duration_seconds=duration_seconds,
@@ -1301,102 +1313,121 @@ async def switch_account(
 # === Helper Functions ===
 
 
+# Service detection keywords for _parse_query
+_QUERY_SERVICE_KEYWORDS: dict[str, list[str]] = {
+    "s3": ["s3", "bucket", "object", "storage"],
+    "ec2": ["ec2", "instance", "ami", "ebs", "volume"],
+    "lambda": ["lambda", "function", "serverless"],
+    "iam": ["iam", "role", "user", "policy", "permission"],
+    "rds": ["rds", "database", "mysql", "postgres", "aurora"],
+    "dynamodb": ["dynamodb", "dynamo", "table", "nosql"],
+    "ecs": ["ecs", "container", "cluster", "task"],
+    "eks": ["eks", "kubernetes", "k8s"],
+    "cloudformation": ["cloudformation", "cfn", "stack"],
+    "cloudwatch": ["cloudwatch", "logs", "metrics", "alarm"],
+    "sns": ["sns", "notification", "topic"],
+    "sqs": ["sqs", "queue", "message"],
+    "secretsmanager": ["secret", "secrets"],
+    "ssm": ["ssm", "parameter"],
+    "route53": ["route53", "dns", "domain"],
+}
+
+# Operation mapping per service for _parse_query
+_QUERY_OPERATION_MAPPING: dict[str, dict[str, str]] = {
+    "s3": {
+        "list": "list_buckets",
+        "show": "list_buckets",
+        "get": "list_buckets",
+        "describe": "list_buckets",
+    },
+    "ec2": {
+        "list": "describe_instances",
+        "show": "describe_instances",
+        "get": "describe_instances",
+        "describe": "describe_instances",
+    },
+    "lambda": {
+        "list": "list_functions",
+        "show": "list_functions",
+        "get": "list_functions",
+    },
+    "iam": {
+        "list": "list_roles",
+        "show": "list_roles",
+        "role": "list_roles",
+        "user": "list_users",
+        "policy": "list_policies",
+    },
+    "rds": {
+        "list": "describe_db_instances",
+        "show": "describe_db_instances",
+        "describe": "describe_db_instances",
+    },
+    "dynamodb": {
+        "list": "list_tables",
+        "show": "list_tables",
+        "table": "list_tables",
+    },
+    "ecs": {
+        "list": "list_clusters",
+        "cluster": "list_clusters",
+        "service": "list_services",
+    },
+    "cloudformation": {
+        "list": "list_stacks",
+        "stack": "list_stacks",
+        "describe": "describe_stacks",
+    },
+    "secretsmanager": {
+        "list": "list_secrets",
+        "secret": "list_secrets",
+    },
+}
+
+# Reverse index so service detection is a single regex pass over the query
+_KEYWORD_TO_SERVICE: dict[str, str] = {
+    kw: svc for svc, kws in _QUERY_SERVICE_KEYWORDS.items() for kw in kws
+}
+_SERVICE_KEYWORD_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_TO_SERVICE, key=len, reverse=True))
+    + ")"
+)
+# One alternation per service finds every operation keyword in a single scan
+_QUERY_OPERATION_RES: dict[str, re.Pattern[str]] = {
+    svc: re.compile("|".join(re.escape(kw) for kw in sorted(mapping, key=len, reverse=True)))
+    for svc, mapping in _QUERY_OPERATION_MAPPING.items()
+}
+
+
 def _parse_query(query: str, service_hint: str | None = None) -> dict[str, Any]:
     """Parse a natural language query into service/operation/parameters."""
     query_lower = query.lower()
 
     # Service detection
-    SERVICE_KEYWORDS = {
-        "s3": ["s3", "bucket", "object", "storage"],
-        "ec2": ["ec2", "instance", "ami", "ebs", "volume"],
-        "lambda": ["lambda", "function", "serverless"],
-        "iam": ["iam", "role", "user", "policy", "permission"],
-        "rds": ["rds", "database", "mysql", "postgres", "aurora"],
-        "dynamodb": ["dynamodb", "dynamo", "table", "nosql"],
-        "ecs": ["ecs", "container", "cluster", "task"],
-        "eks": ["eks", "kubernetes", "k8s"],
-        "cloudformation": ["cloudformation", "cfn", "stack"],
-        "cloudwatch": ["cloudwatch", "logs", "metrics", "alarm"],
-        "sns": ["sns", "notification", "topic"],
-        "sqs": ["sqs", "queue", "message"],
-        "secretsmanager": ["secret", "secrets"],
-        "ssm": ["ssm", "parameter"],
-        "route53": ["route53", "dns", "domain"],
-    }
-
     detected_service = service_hint
     if not detected_service:
-        for svc, keywords in SERVICE_KEYWORDS.items():
-            if any(kw in query_lower for kw in keywords):
-                detected_service = svc
-                break
+        match = _SERVICE_KEYWORD_RE.search(query_lower)
+        if match:
+            detected_service = _KEYWORD_TO_SERVICE[match.group(1)]
 
     # Operation detection
-    OPERATION_MAPPING = {
-        "s3": {
-            "list": "list_buckets",
-            "show": "list_buckets",
-            "get": "list_buckets",
-            "describe": "list_buckets",
-        },
-        "ec2": {
-            "list": "describe_instances",
-            "show": "describe_instances",
-            "get": "describe_instances",
-            "describe": "describe_instances",
-        },
-        "lambda": {
-            "list": "list_functions",
-            "show": "list_functions",
-            "get": "list_functions",
-        },
-        "iam": {
-            "list": "list_roles",
-            "show": "list_roles",
-            "role": "list_roles",
-            "user": "list_users",
-            "policy": "list_policies",
-        },
-        "rds": {
-            "list": "describe_db_instances",
-            "show": "describe_db_instances",
-            "describe": "describe_db_instances",
-        },
-        "dynamodb": {
-            "list": "list_tables",
-            "show": "list_tables",
-            "table": "list_tables",
-        },
-        "ecs": {
-            "list": "list_clusters",
-            "cluster": "list_clusters",
-            "service": "list_services",
-        },
-        "cloudformation": {
-            "list": "list_stacks",
-            "stack": "list_stacks",
-            "describe": "describe_stacks",
-        },
-        "secretsmanager": {
-            "list": "list_secrets",
-            "secret": "list_secrets",
-        },
-    }
-
     detected_operation = None
     resource_type = None
 
-    if detected_service and detected_service in OPERATION_MAPPING:
-        mapping = OPERATION_MAPPING[detected_service]
+    if detected_service and detected_service in _QUERY_OPERATION_MAPPING:
+        mapping = _QUERY_OPERATION_MAPPING[detected_service]
+        found = set(_QUERY_OPERATION_RES[detected_service].findall(query_lower))
+        # Mapping order decides between several matching keywords
         for keyword, operation in mapping.items():
-            if keyword in query_lower:
+            if keyword in found:
                 detected_operation = operation
                 resource_type = keyword
                 break
 
         # Default to first operation if service detected but no specific operation
         if not detected_operation:
-            detected_operation = list(mapping.values())[0]
+            detected_operation = next(iter(mapping.values()))
 
     return {
         "service": detected_service,
@@ -1414,8 +1445,8 @@ async def _execute_with_pagination(
     """Execute an operation with automatic pagination."""
     config = get_config()
 
-    # Check if operation supports pagination
-    try:
+    # Operations without a paginator are called directly
+    if client.can_paginate(operation):
         paginator = client.get_paginator(operation)
         results = []
         item_count = 0
@@ -1435,17 +1466,15 @@ async def _execute_with_pagination(
 
         return results
 
-    except Exception:
-        # Operation doesn't support pagination, execute directly
-        method = getattr(client, operation)
-        response = method(**parameters)
+    method = getattr(client, operation)
+    response = method(**parameters)
 
-        # Extract the main data from response
-        for key, value in response.items():
-            if key != "ResponseMetadata" and isinstance(value, list):
-                return value
+    # Extract the main data from response
+    for key, value in response.items():
+        if key != "ResponseMetadata" and isinstance(value, list):
+            return value
 
-        return response
+    return response
 
 
 def main() -> None:
@@ -1464,6 +1493,11 @@ def main() -> None:
         default="us-east-1",
         help="Default AWS region",
     )
+    parser.add_argument(
+        "--no-tables",
+        action="store_true",
+        help="Return JSON data only, without markdown tables",
+    )
 
     args = parser.parse_args()
 
@@ -1471,6 +1505,8 @@ def main() -> None:
     config = ServerConfig.from_env()
     config.safety.mode = SafetyMode(args.safety_mode)
     config.default_region = args.region
+    if args.no_tables:
+        config.format_tables = False
     set_config(config)
 
     logger.info(
@@ -10,6 +10,7 @@ import boto3
 import structlog
 
 from aws_sage.config import OperationCategory
+from aws_sage.core.serialization import dumps_json
 from aws_sage.safety.classifier import OperationClassifier
 
 logger = structlog.get_logger()
@@ -235,9 +236,7 @@ class BaseService(ABC):
         Override this in subclasses for service-specific formatting.
         """
         if format_type == "json":
-            import json
-
-            return json.dumps(data, indent=2, default=str)
+            return dumps_json(data)
 
         if isinstance(data, list) and data:
             return self._format_as_table(data)
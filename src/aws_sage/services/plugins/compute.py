@@ -139,8 +139,7 @@ class EC2Service(BaseService):
     def format_response(self, data: Any, format_type: str = "table") -> str:
         """Custom formatting for EC2 responses."""
         if format_type == "json":
-            import json
-            return json.dumps(data, indent=2, default=str)
+            return super().format_response(data, format_type)
 
         if isinstance(data, list) and data:
             first = data[0]
@@ -283,8 +282,7 @@ class LambdaService(BaseService):
     def format_response(self, data: Any, format_type: str = "table") -> str:
         """Custom formatting for Lambda responses."""
         if format_type == "json":
-            import json
-            return json.dumps(data, indent=2, default=str)
+            return super().format_response(data, format_type)
 
         if isinstance(data, list) and data and "FunctionName" in data[0]:
             return self._format_functions(data)
@@ -125,8 +125,7 @@ class IAMService(BaseService):
     def format_response(self, data: Any, format_type: str = "table") -> str:
         """Custom formatting for IAM responses."""
         if format_type == "json":
-            import json
-            return json.dumps(data, indent=2, default=str)
+            return super().format_response(data, format_type)
 
         if isinstance(data, list) and data:
             first = data[0]
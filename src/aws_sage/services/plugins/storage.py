@@ -103,8 +103,7 @@ class S3Service(BaseService):
     def format_response(self, data: Any, format_type: str = "table") -> str:
         """Custom formatting for S3 responses."""
         if format_type == "json":
-            import json
-            return json.dumps(data, indent=2, default=str)
+            return super().format_response(data, format_type)
 
         if isinstance(data, list) and data:
             # Format buckets
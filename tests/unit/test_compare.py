@@ -0,0 +1,253 @@
+"""Tests for the environment comparison module."""
+
+import json
+
+import boto3
+import pytest
+
+from aws_sage.core.environment import EnvironmentConfig, EnvironmentType
+from aws_sage.differentiators.compare import (
+    EnvironmentComparer,
+    ResourceDifference,
+    _get_describe_executor,
+    reset_environment_comparer,
+)
+
+
+@pytest.fixture
+def source_env() -> EnvironmentConfig:
+    """Source environment in us-east-1."""
+    return EnvironmentConfig(name="source", type=EnvironmentType.PRODUCTION, region="us-east-1")
+
+
+@pytest.fixture
+def target_env() -> EnvironmentConfig:
+    """Target environment in us-west-2."""
+    return EnvironmentConfig(name="target", type=EnvironmentType.PRODUCTION, region="us-west-2")
+
+
+def _create_table(region: str, name: str, key: str) -> None:
+    """Create a DynamoDB table with a single hash key."""
+    boto3.client("dynamodb", region_name=region).create_table(
+        TableName=name,
+        KeySchema=[{"AttributeName": key, "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": key, "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+class TestDynamoDBComparison:
+    """Tests for DynamoDB table comparison."""
+
+    @pytest.mark.asyncio
+    async def test_compare_tables(
+        self,
+        mock_aws_services: None,
+        source_env: EnvironmentConfig,
+        target_env: EnvironmentConfig,
+    ) -> None:
+        """Test that shared tables are described and schema changes reported."""
+        _create_table("us-east-1", "users", "id")
+        _create_table("us-east-1", "orders", "order_id")
+        _create_table("us-east-1", "legacy", "id")
+        _create_table("us-west-2", "users", "id")
+        _create_table("us-west-2", "orders", "id")
+        _create_table("us-west-2", "audit", "id")
+
+        result = await EnvironmentComparer().compare_environments(
+            "dynamodb", source_env, target_env
+        )
+
+        assert not result.errors
+        assert [r.identifier for r in result.only_in_source] == ["legacy"]
+        assert [r.identifier for r in result.only_in_target] == ["audit"]
+        assert result.identical_count == 1
+        assert [r.identifier for r in result.different] == ["orders"]
+        assert json.loads(result.to_json()) == result.to_dict()
+        assert result.different[0].difference == ResourceDifference.DIFFERENT
+        assert any("Key schema" in d for d in result.different[0].differences)
+
+
+class TestEnvironmentComparerClients:
+    """Tests for comparison client reuse."""
+
+    def test_clients_cached_per_environment(
+        self,
+        aws_credentials: None,
+        source_env: EnvironmentConfig,
+        target_env: EnvironmentConfig,
+    ) -> None:
+        """Test that clients are reused per service and environment."""
+        comparer = EnvironmentComparer()
+        client = comparer._get_client("s3", source_env)
+
+        assert comparer._get_client("s3", source_env) is client
+        assert comparer._get_client("s3", target_env) is not client
+        assert comparer._get_client("sqs", source_env) is not client
+
+        source_env.region = "eu-west-1"
+        assert comparer._get_client("s3", source_env).meta.region_name == "eu-west-1"
+
+
+class TestDescribeExecutor:
+    """Tests for the shared describe thread pool."""
+
+    def test_executor_reused_until_reset(self) -> None:
+        """Test the pool is created once and shut down on reset."""
+        executor = _get_describe_executor()
+        assert _get_describe_executor() is executor
+
+        reset_environment_comparer()
+        assert executor._shutdown
+        assert _get_describe_executor() is not executor
+        reset_environment_comparer()
+
+
+class TestPaginatedListing:
+    """Tests for listing resources across pages."""
+
+    @pytest.mark.asyncio
+    async def test_compare_queues_reads_all_pages(
+        self,
+        mock_aws_services: None,
+        source_env: EnvironmentConfig,
+        target_env: EnvironmentConfig,
+    ) -> None:
+        """Test that resources past the first page are compared."""
+        sqs = boto3.client("sqs", region_name="us-east-1")
+        for i in range(1005):
+            sqs.create_queue(QueueName=f"queue-{i}")
+
+        result = await EnvironmentComparer().compare_environments("sqs", source_env, target_env)
+
+        assert not result.errors
+        assert len(result.only_in_source) == 1005
+
+    @pytest.mark.asyncio
+    async def test_compare_tables_past_page_limit(
+        self,
+        mock_aws_services: None,
+        source_env: EnvironmentConfig,
+        target_env: EnvironmentConfig,
+    ) -> None:
+        """Test that more tables than one list_tables page (100) are all compared."""
+        for i in range(101):
+            _create_table("us-east-1", f"table-{i:03d}", "id")
+        _create_table("us-west-2", "table-100", "id")
+
+        result = await EnvironmentComparer().compare_environments(
+            "dynamodb", source_env, target_env
+        )
+
+        assert not result.errors
+        assert len(result.only_in_source) == 100
+        assert result.identical_count == 1
+
+
+class TestConfigDiffs:
+    """Tests for the per-resource configuration comparisons."""
+
+    def test_lambda_config_differences(self) -> None:
+        """Test that each differing Lambda field is reported."""
+        source = {"Runtime": "python3.12", "MemorySize": 128, "Timeout": 3, "Handler": "a.h"}
+        target = {**source, "MemorySize": 256, "Handler": "b.h"}
+
+        assert EnvironmentComparer()._compare_lambda_configs(source, target) == [
+            "Memory differs: 128 vs 256",
+            "Handler differs: a.h vs b.h",
+        ]
+        assert EnvironmentComparer()._compare_lambda_configs(source, dict(source)) == []
+
+    def test_table_schema_order_insensitive(self) -> None:
+        """Test that attribute definitions in a different order are not a difference."""
+        source = {
+            "KeySchema": [{"AttributeName": "id", "KeyType": "HASH"}],
+            "AttributeDefinitions": [
+                {"AttributeName": "id", "AttributeType": "S"},
+                {"AttributeName": "ts", "AttributeType": "N"},
+            ],
+        }
+        target = {**source, "AttributeDefinitions": source["AttributeDefinitions"][::-1]}
+
+        assert EnvironmentComparer()._compare_table_schemas(source, target) == []
+
+
+class TestServiceComparisons:
+    """Tests for the S3, SNS and Lambda comparisons."""
+
+    @pytest.mark.asyncio
+    async def test_compare_buckets_and_topics(
+        self,
+        mock_aws_services: None,
+        source_env: EnvironmentConfig,
+        target_env: EnvironmentConfig,
+    ) -> None:
+        """Test that bucket and topic names are matched across environments."""
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="only-source")
+        s3.create_bucket(Bucket="shared")
+        for region, names in (("us-east-1", ["alerts", "legacy"]), ("us-west-2", ["alerts"])):
+            sns = boto3.client("sns", region_name=region)
+            for name in names:
+                sns.create_topic(Name=name)
+
+        comparer = EnvironmentComparer()
+        buckets = await comparer.compare_environments("S3", source_env, source_env)
+        topics = await comparer.compare_environments("sns", source_env, target_env)
+
+        assert buckets.to_dict()["summary"] == {
+            "only_in_source": 0,
+            "only_in_target": 0,
+            "different": 0,
+            "identical": 2,
+        }
+        assert [r.to_dict() for r in topics.only_in_source] == [
+            {
+                "resource_type": "topic",
+                "identifier": "legacy",
+                "difference": "only_in_source",
+                "source_value": {"topic_name": "legacy"},
+                "target_value": None,
+                "differences": [],
+            }
+        ]
+        assert topics.identical_count == 1
+
+    @pytest.mark.asyncio
+    async def test_compare_functions(
+        self,
+        mock_aws_services: None,
+        source_env: EnvironmentConfig,
+        target_env: EnvironmentConfig,
+    ) -> None:
+        """Test that Lambda functions are compared by configuration."""
+        role = boto3.client("iam", region_name="us-east-1").create_role(
+            RoleName="lambda-role", AssumeRolePolicyDocument="{}"
+        )["Role"]["Arn"]
+        for region, functions in (
+            ("us-east-1", {"api": 128, "worker": 128, "cron": 256}),
+            ("us-west-2", {"api": 128, "worker": 512}),
+        ):
+            client = boto3.client("lambda", region_name=region)
+            for name, memory in functions.items():
+                client.create_function(
+                    FunctionName=name,
+                    Runtime="python3.12",
+                    Role=role,
+                    Handler="index.handler",
+                    Code={"ZipFile": b"code"},
+                    MemorySize=memory,
+                )
+
+        result = await EnvironmentComparer().compare_environments("lambda", source_env, target_env)
+
+        assert not result.errors
+        assert result.only_in_source[0].source_value == {
+            "function_name": "cron",
+            "runtime": "python3.12",
+            "memory": 256,
+        }
+        assert [(r.identifier, r.differences) for r in result.different] == [
+            ("worker", ["Memory differs: 128 vs 512"])
+        ]
+        assert result.identical_count == 1
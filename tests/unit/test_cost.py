@@ -308,6 +308,37 @@ class TestCostAnalyzerPricing:
         assert abs(cost - 30.37) < 0.5  # Allow small variance
 
 
+class TestFindIdleResources:
+    """Tests for find_idle_resources dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_to_requested_detectors(self):
+        """Test each requested service runs its detector and unknown ones are skipped."""
+        analyzer = CostAnalyzer()
+        volume = IdleResource(
+            arn="arn:aws:ec2:us-east-1:123456789:volume/vol-123",
+            service="ec2",
+            resource_type="ebs_volume",
+            name=None,
+            region="us-east-1",
+            reason=IdleReason.UNATTACHED,
+            estimated_monthly_cost=8.0,
+        )
+
+        ebs = AsyncMock(return_value=[volume])
+        eip = AsyncMock(side_effect=RuntimeError("denied"))
+        with patch.dict(CostAnalyzer._IDLE_DETECTORS, {"ebs": ebs, "eip": eip}):
+            result = await analyzer.find_idle_resources(
+                services=["ebs", "eip", "unknown"], region="us-east-1", lookback_days=7
+            )
+
+        ebs.assert_awaited_once_with(analyzer, "us-east-1", 7)
+        eip.assert_awaited_once_with(analyzer, "us-east-1", 7)
+        assert result.idle_resources == [volume]
+        assert result.total_potential_savings == 8.0
+        assert result.errors == ["eip: denied"]
+
+
 class TestProjectCosts:
     """Tests for project_costs method."""
 
@@ -0,0 +1,28 @@
+"""Tests for the differentiators package exports."""
+
+import importlib
+
+import pytest
+
+import aws_sage.differentiators as differentiators
+
+
+class TestDifferentiatorExports:
+    """Tests for the lazily loaded package namespace."""
+
+    @pytest.mark.parametrize("name", differentiators.__all__)
+    def test_all_exports_resolve(self, name: str) -> None:
+        """Test that every name in __all__ can be imported from the package."""
+        module = importlib.import_module(
+            f"aws_sage.differentiators.{differentiators._LAZY_ATTRS[name]}"
+        )
+        assert getattr(differentiators, name) is getattr(module, name)
+
+    def test_all_matches_lazy_attrs(self) -> None:
+        """Test that __all__ and the lazy import table list the same names."""
+        assert sorted(differentiators.__all__) == sorted(differentiators._LAZY_ATTRS)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            differentiators.NotAThing  # noqa: B018
@@ -147,6 +147,21 @@ class TestEnvironmentConfig:
         assert kwargs["region_name"] == "us-east-1"
         assert kwargs["aws_access_key_id"] == "test"
 
+    def test_get_client_kwargs_returns_copy(self):
+        """Test that cached client kwargs are copied and follow config changes."""
+        config = EnvironmentConfig(
+            name="prod",
+            type=EnvironmentType.PRODUCTION,
+            region="eu-west-1",
+        )
+
+        kwargs = config.get_client_kwargs("s3")
+        kwargs["region_name"] = "ap-south-1"
+        assert config.get_client_kwargs("s3")["region_name"] == "eu-west-1"
+
+        config.region = "us-west-2"
+        assert config.get_client_kwargs("s3")["region_name"] == "us-west-2"
+
 
 class TestLocalStackServices:
     """Tests for LocalStack service sets."""
@@ -393,13 +408,7 @@ class TestComparisonResult:
                     difference=ResourceDifference.ONLY_IN_SOURCE,
                 )
             ],
-            identical=[
-                ResourceComparison(
-                    resource_type="bucket",
-                    identifier="shared-bucket",
-                    difference=ResourceDifference.IDENTICAL,
-                )
-            ],
+            identical_count=1,
         )
 
         data = result.to_dict()
@@ -1,11 +1,12 @@
 """Tests for the execution engine module."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError
 
-from aws_sage.config import OperationCategory, SafetyMode
+from aws_sage.config import OperationCategory, SafetyMode, ServerConfig, set_config
 from aws_sage.core.session import SessionManager
 from aws_sage.execution.engine import (
     ExecutionEngine,
@@ -13,6 +14,7 @@ from aws_sage.execution.engine import (
     get_execution_engine,
     reset_execution_engine,
 )
+from aws_sage.execution.pagination import PaginationHandler
 from aws_sage.parser.schemas import StructuredCommand
 
 
@@ -71,6 +73,30 @@ class TestExecutionResult:
         assert '"status": "success"' in json_str
         assert '"key": "value"' in json_str
 
+    def test_to_ndjson_list(self) -> None:
+        """Test NDJSON serialization emits a summary line then one line per item."""
+        result = ExecutionResult(
+            success=True,
+            data=[{"Name": "bucket1"}, {"Name": "bucket2"}],
+            formatted_table="| Name |",
+            service="s3",
+            count=2,
+        )
+        lines = result.to_ndjson().splitlines()
+        assert len(lines) == 3
+        summary = json.loads(lines[0])
+        assert summary["count"] == 2
+        assert "data" not in summary
+        assert "formatted_table" not in summary
+        assert json.loads(lines[2]) == {"Name": "bucket2"}
+
+    def test_to_ndjson_error(self) -> None:
+        """Test NDJSON serialization of a non-list result is a single line."""
+        result = ExecutionResult(success=False, error="boom")
+        lines = result.to_ndjson().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["error"] == "boom"
+
 
 class TestExecutionEngine:
     """Tests for ExecutionEngine."""
@@ -395,6 +421,55 @@ class TestStructuredCommandExecution:
         assert result.success
         assert result.category == "read"
 
+    @pytest.mark.asyncio
+    async def test_execute_command_without_tables(
+        self, engine: ExecutionEngine, mock_session_manager: MagicMock
+    ) -> None:
+        """Test that table formatting is skipped when disabled."""
+        set_config(ServerConfig(format_tables=False))
+        mock_client = MagicMock()
+        mock_client.can_paginate.return_value = False
+        mock_client.list_buckets.return_value = {
+            "Buckets": [{"Name": "bucket1"}],
+            "ResponseMetadata": {},
+        }
+        mock_session_manager.get_client.return_value = mock_client
+
+        command = StructuredCommand(
+            service="s3",
+            operation="list_buckets",
+            parameters={},
+            category=OperationCategory.READ,
+        )
+        result = await engine.execute_command(command)
+        assert result.success
+        assert result.count == 1
+        assert result.formatted_table is None
+
+    @pytest.mark.asyncio
+    async def test_execute_natural_language_skips_table(
+        self, engine: ExecutionEngine, mock_session_manager: MagicMock
+    ) -> None:
+        """Test that no table is rendered when the caller opts out."""
+        set_config(ServerConfig(format_tables=True))
+        mock_client = MagicMock()
+        mock_client.can_paginate.return_value = False
+        mock_client.list_buckets.return_value = {
+            "Buckets": [{"Name": "bucket1"}],
+            "ResponseMetadata": {},
+        }
+        mock_session_manager.get_client.return_value = mock_client
+
+        with patch.object(engine, "_format_as_table") as format_table:
+            result = await engine.execute_natural_language(
+                "list s3 buckets", build_table=False
+            )
+
+        assert result.success
+        assert result.count == 1
+        assert result.formatted_table is None
+        format_table.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_command_with_parameters(
         self, engine: ExecutionEngine, mock_session_manager: MagicMock
@@ -421,3 +496,39 @@ class TestStructuredCommandExecution:
         assert result.success
         # Pagination is used, so verify paginator was called instead
         mock_client.get_paginator.assert_called_with("list_objects_v2")
+
+
+class TestPaginationHandler:
+    """Tests for PaginationHandler."""
+
+    def test_non_paginated_operation_uses_single_call(self) -> None:
+        """Test that operations without a paginator are called directly."""
+        mock_client = MagicMock()
+        mock_client.can_paginate.return_value = False
+        mock_client.get_bucket_tagging.return_value = {"TagSet": [{"Key": "env"}]}
+
+        handler = PaginationHandler()
+        results, truncated = handler.execute_paginated(
+            mock_client, "get_bucket_tagging", {"Bucket": "test-bucket"}
+        )
+
+        assert results == [{"Key": "env"}]
+        assert not truncated
+        mock_client.get_paginator.assert_not_called()
+
+    def test_paginated_operation_collects_pages(self) -> None:
+        """Test that paginated operations aggregate every page."""
+        mock_client = MagicMock()
+        mock_client.can_paginate.return_value = True
+        mock_paginator = MagicMock()
+        mock_paginator.paginate.return_value = [
+            {"Buckets": [{"Name": "a"}], "ResponseMetadata": {}},
+            {"Buckets": [{"Name": "b"}], "ResponseMetadata": {}},
+        ]
+        mock_client.get_paginator.return_value = mock_paginator
+
+        handler = PaginationHandler()
+        results, truncated = handler.execute_paginated(mock_client, "list_buckets")
+
+        assert results == [{"Name": "a"}, {"Name": "b"}]
+        assert not truncated
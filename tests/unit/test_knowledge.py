@@ -0,0 +1,342 @@
+"""Tests for the AWS knowledge proxy."""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from aws_sage.composition.knowledge_proxy import (
+    AWSKnowledgeProxy,
+    KnowledgeCategory,
+    KnowledgeItem,
+    KnowledgeSource,
+    LiveQueryResult,
+    get_knowledge_proxy,
+)
+
+
+@pytest.fixture
+def proxy() -> AWSKnowledgeProxy:
+    """Create a knowledge proxy without an MCP server."""
+    return AWSKnowledgeProxy()
+
+
+class TestKnowledgeItem:
+    """Tests for KnowledgeItem."""
+
+    def test_to_dict(self) -> None:
+        """Test KnowledgeItem serialization."""
+        item = KnowledgeItem(
+            title="Title",
+            content="Content",
+            category=KnowledgeCategory.SECURITY,
+            service="s3",
+        )
+        d = item.to_dict()
+        assert d["title"] == "Title"
+        assert d["category"] == "security"
+        assert d["source_type"] == "builtin"
+        assert "_dict" not in d
+
+    def test_to_dict_is_cached(self) -> None:
+        """Test that the serialized form is built once per item."""
+        item = KnowledgeItem(title="T", content="C", category=KnowledgeCategory.LIMITS)
+        assert item.to_dict() is item.to_dict()
+
+    def test_is_immutable(self) -> None:
+        """Test that items cannot be modified after construction."""
+        item = KnowledgeItem(title="T", content="C", category=KnowledgeCategory.LIMITS)
+        with pytest.raises(AttributeError):
+            item.title = "Other"  # type: ignore[misc]
+
+
+class TestLiveQueryResult:
+    """Tests for LiveQueryResult."""
+
+    def test_to_dict(self) -> None:
+        """Test LiveQueryResult serialization."""
+        item = KnowledgeItem(
+            title="T",
+            content="C",
+            category=KnowledgeCategory.ARCHITECTURE,
+            related_services=("s3", "cloudfront"),
+        )
+        result = LiveQueryResult(success=True, items=(item,), source=KnowledgeSource.AWS_DOCS)
+        d = result.to_dict()
+        assert d["items_count"] == 1
+        assert d["source"] == "aws_docs"
+        assert d["items"][0]["related_services"] == ["s3", "cloudfront"]
+        assert result.to_dict() is d
+
+
+class TestBuiltinKnowledgeSearch:
+    """Tests for searching the built-in knowledge base."""
+
+    @pytest.mark.asyncio
+    async def test_best_practices_scoped_to_service(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that best practices are returned for the requested service."""
+        items = await proxy.get_best_practices("lambda")
+        assert [item.title for item in items] == ["Lambda Best Practices"]
+
+    @pytest.mark.asyncio
+    async def test_security_guidance(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that security guidance is filtered by category."""
+        items = await proxy.get_security_guidance("s3")
+        assert items
+        assert all(item.category == KnowledgeCategory.SECURITY for item in items)
+
+    @pytest.mark.asyncio
+    async def test_service_without_builtin_items_falls_back(
+        self, proxy: AWSKnowledgeProxy
+    ) -> None:
+        """Test that services without built-in items get guidance from other services."""
+        items = await proxy.get_service_limits("kinesis")
+        assert items
+        assert all(item.category == KnowledgeCategory.LIMITS for item in items)
+
+    @pytest.mark.asyncio
+    async def test_unscoped_query_searches_all_services(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that a question without a service searches every bucket."""
+        items = await proxy.query("enable mfa for root users")
+        assert "IAM Best Practices" in [item.title for item in items]
+
+    @pytest.mark.asyncio
+    async def test_keywords_match_inside_words(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that keywords match as substrings of the item text."""
+        items = await proxy.query("bucket limit", service="s3")
+        assert "S3 Service Limits" in [item.title for item in items]
+
+    @pytest.mark.asyncio
+    async def test_no_match(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that unrelated questions return nothing."""
+        assert await proxy.query("zzzz qqqq xxxx") == []
+
+    @pytest.mark.asyncio
+    async def test_query_many_preserves_order(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that batched queries return results in request order."""
+        results = await proxy.query_many(
+            [
+                ("security best practices for s3", "s3", KnowledgeCategory.SECURITY),
+                ("limits and quotas for lambda", "lambda", KnowledgeCategory.LIMITS),
+            ]
+        )
+        assert [[item.title for item in items] for items in results] == [
+            ["S3 Security Best Practices"],
+            ["Lambda Limits"],
+        ]
+
+    def test_reordered_question_shares_cache_entry(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that word order and spacing don't create separate cache entries."""
+        AWSKnowledgeProxy._search_builtin_cached.cache_clear()
+        first = proxy._search_builtin_knowledge("S3 bucket  limits", "s3", None)
+        second = proxy._search_builtin_knowledge("limits bucket s3", "s3", None)
+        assert first == second
+        assert AWSKnowledgeProxy._search_builtin_cached.cache_info().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_returns_fresh_list(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that memoized searches still hand callers their own list."""
+        first = await proxy.get_best_practices("s3")
+        first.clear()
+        second = await proxy.get_best_practices("s3")
+        assert second
+
+
+class TestKnowledgeMCPClient:
+    """Tests for querying the AWS Knowledge MCP server."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_pooled_client(self) -> None:
+        """Test that successive queries share one HTTP client."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"results": [{"title": "Doc", "content": "Text"}]})
+
+        proxy = AWSKnowledgeProxy("https://knowledge.example.com")
+        proxy._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = proxy._get_http_client()
+
+        first = await proxy._query_aws_knowledge_mcp("s3 encryption", "s3", timeout=5.0)
+        second = await proxy._query_aws_knowledge_mcp("s3 versioning", "s3", timeout=5.0)
+
+        assert proxy._get_http_client() is client
+        assert len(requests) == 2
+        assert requests[0].headers["Content-Type"] == "application/json"
+        body = json.loads(requests[0].content)
+        assert body["arguments"] == {"query": "s3 encryption", "service": "s3"}
+        assert first.success and second.success
+        assert first.source == KnowledgeSource.AWS_KNOWLEDGE_MCP
+        assert first.items[0].title == "Doc"
+
+        await proxy.close()
+        assert proxy._http is None
+
+    @pytest.mark.asyncio
+    async def test_error_status(self) -> None:
+        """Test that a non-200 response is reported as a failure."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503, text="unavailable")
+
+        proxy = AWSKnowledgeProxy("https://knowledge.example.com")
+        proxy._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await proxy._query_aws_knowledge_mcp("s3 encryption", "s3", timeout=5.0)
+        assert not result.success
+        assert result.error == "MCP server returned status 503"
+        await proxy.close()
+
+    def test_parse_response_skips_non_dict_results(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that malformed rows are dropped and results are capped at five."""
+        rows = [{"title": f"Doc {i}", "text": "body"} for i in range(6)]
+        items = proxy._parse_mcp_response({"results": ["bad", *rows]}, "s3")
+        assert [item.title for item in items] == ["Doc 0", "Doc 1", "Doc 2", "Doc 3"]
+        assert items[0].content == "body"
+        assert items[0].source_type == KnowledgeSource.AWS_KNOWLEDGE_MCP
+        assert proxy._parse_mcp_response({"results": "bad"}, None) == []
+
+
+class TestQueryLive:
+    """Tests for live knowledge queries."""
+
+    @pytest.mark.asyncio
+    async def test_prefers_mcp_results(self) -> None:
+        """Test that MCP results win over AWS docs when both succeed."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"results": [{"title": "MCP Doc", "content": "x"}]})
+
+        proxy = AWSKnowledgeProxy("https://knowledge.example.com")
+        proxy._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await proxy.query_live("s3 encryption", service="s3")
+        assert result.source == KnowledgeSource.AWS_KNOWLEDGE_MCP
+        assert result.items[0].title == "MCP Doc"
+        await proxy.close()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_docs_when_mcp_fails(self) -> None:
+        """Test that AWS docs results are used when the MCP server errors."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("unreachable")
+
+        proxy = AWSKnowledgeProxy("https://knowledge.example.com")
+        proxy._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await proxy.query_live("s3 encryption", service="s3")
+        assert result.source == KnowledgeSource.AWS_DOCS
+        assert not result.fallback_used
+        await proxy.close()
+
+    @pytest.mark.asyncio
+    async def test_docs_result_shared_per_service(self, proxy: AWSKnowledgeProxy) -> None:
+        """Test that documentation results are built once per service."""
+        first = await proxy._query_aws_docs("encryption", "S3", timeout=5.0)
+        second = await proxy._query_aws_docs("versioning", "s3", timeout=5.0)
+        assert second is first
+        assert first.items[0].title == "Amazon S3 User Guide"
+        assert first.items[-1].title == "AWS Well-Architected Framework"
+
+    @pytest.mark.asyncio
+    async def test_repeated_question_served_from_cache(self) -> None:
+        """Test that an identical live query does not hit the network again."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json={"results": [{"title": "MCP Doc", "content": "x"}]})
+
+        proxy = AWSKnowledgeProxy("https://knowledge.example.com")
+        proxy._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        first = await proxy.query_live("S3 encryption", service="s3")
+        second = await proxy.query_live("s3 encryption ", service="S3")
+        assert calls == 1
+        assert second is first
+        await proxy.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_questions_share_one_request(self) -> None:
+        """Test that concurrent callers with the same question are coalesced."""
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"results": [{"title": "MCP Doc", "content": "x"}]})
+
+        proxy = AWSKnowledgeProxy("https://knowledge.example.com")
+        proxy._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = await asyncio.gather(
+            *(proxy.query_live("s3 encryption", service="s3") for _ in range(5))
+        )
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert not proxy._live_inflight
+        await proxy.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self) -> None:
+        """Test that a stale cached result is returned and refreshed in the background."""
+        titles = iter(["First", "Second"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"results": [{"title": next(titles), "content": "x"}]})
+
+        proxy = AWSKnowledgeProxy("https://knowledge.example.com")
+        proxy._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        first = await proxy.query_live("s3 encryption", service="s3")
+        key = next(iter(proxy._live_cache))
+        proxy._live_cache[key] = (time.monotonic() - 10_000, first)  # Age past the TTL
+
+        stale = await proxy.query_live("s3 encryption", service="s3")
+        assert stale is first
+        await proxy._live_inflight[key]
+
+        refreshed = await proxy.query_live("s3 encryption", service="s3")
+        assert refreshed.items[0].title == "Second"
+        await proxy.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the live cache keeps recently read entries when full."""
+        monkeypatch.setattr("aws_sage.composition.knowledge_proxy._LIVE_CACHE_MAX_ENTRIES", 2)
+        proxy = AWSKnowledgeProxy()
+
+        await proxy.query_live("first", service="s3")
+        await proxy.query_live("second", service="s3")
+        await proxy.query_live("first", service="s3")
+        await proxy.query_live("third", service="s3")
+
+        assert [key[0] for key in proxy._live_cache] == ["first", "third"]
+
+
+class TestGetKnowledgeProxy:
+    """Tests for the shared knowledge proxy accessor."""
+
+    def test_concurrent_first_calls_share_proxy(self) -> None:
+        """Test that racing first callers all get the same proxy."""
+        url = "https://concurrent.example.com"
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            proxies = list(pool.map(lambda _: get_knowledge_proxy(url), range(32)))
+        assert all(proxy is proxies[0] for proxy in proxies)
+
+    def test_shared_per_url(self) -> None:
+        """Test that each MCP server URL gets one shared proxy."""
+        assert get_knowledge_proxy() is get_knowledge_proxy(None)
+        other = get_knowledge_proxy("https://knowledge.example.com")
+        assert other is get_knowledge_proxy("https://knowledge.example.com")
+        assert other is not get_knowledge_proxy()
+        assert other.mcp_server_url == "https://knowledge.example.com"
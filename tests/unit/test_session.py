@@ -0,0 +1,201 @@
+"""Tests for the session management module."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import NoCredentialsError
+from botocore.utils import JSONFileCache
+
+from aws_sage.core.exceptions import AuthenticationError
+from aws_sage.core.session import (
+    SessionManager,
+    _list_profiles_cached,
+    _profile_types_cached,
+    create_session,
+)
+
+
+class TestSessionManagerClients:
+    """Tests for SessionManager client handling."""
+
+    def test_get_client_reuses_client(
+        self, mock_aws_services: None, session_manager: SessionManager
+    ) -> None:
+        """Test that repeated lookups return the same client."""
+        first = session_manager.get_client("s3")
+        second = session_manager.get_client("s3")
+        assert first is second
+
+    def test_get_client_per_region(
+        self, mock_aws_services: None, session_manager: SessionManager
+    ) -> None:
+        """Test that clients are cached separately per region."""
+        east = session_manager.get_client("s3", "us-east-1")
+        west = session_manager.get_client("s3", "us-west-2")
+        assert east is not west
+        assert west.meta.region_name == "us-west-2"
+
+    def test_set_region_switches_clients(
+        self, mock_aws_services: None, session_manager: SessionManager
+    ) -> None:
+        """Test that changing region uses clients for the new region."""
+        session = session_manager.get_session()
+        first = session_manager.get_client("s3")
+        session_manager.set_region("eu-west-1")
+        second = session_manager.get_client("s3")
+        assert first is not second
+        assert second.meta.region_name == "eu-west-1"
+        assert session_manager.get_session() is session
+
+        session_manager.set_region(first.meta.region_name)
+        assert session_manager.get_client("s3") is first
+
+    def test_get_resource_reuses_resource(
+        self, mock_aws_services: None, session_manager: SessionManager
+    ) -> None:
+        """Test that resources are cached per region."""
+        first = session_manager.get_resource("s3")
+        assert session_manager.get_resource("s3") is first
+        session_manager.set_region("eu-west-1")
+        assert session_manager.get_resource("s3") is not first
+
+
+class TestSessionManagerProfiles:
+    """Tests for SessionManager profile listing."""
+
+    def test_list_profiles_refreshes_on_config_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that cached profiles are reused until the config file changes."""
+        config_file = tmp_path / "config"
+        config_file.write_text("[profile dev]\nregion = us-east-1\n")
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(config_file))
+        monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(tmp_path / "credentials"))
+        manager = SessionManager()
+
+        _list_profiles_cached.cache_clear()
+        assert manager.list_profiles() == ["dev"]
+        assert SessionManager().list_profiles() == ["dev"]
+        assert _list_profiles_cached.cache_info().hits == 1
+
+        config_file.write_text("[profile dev]\n[profile prod]\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert manager.list_profiles() == ["dev", "prod"]
+
+    def test_get_profile_details_types(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that profile types are read from the config and credentials files."""
+        config_file = tmp_path / "config"
+        config_file.write_text(
+            "[default]\nregion = us-east-1\n"
+            "[profile sso]\nsso_start_url = https://example.awsapps.com/start\n"
+            "[profile admin]\nrole_arn = arn:aws:iam::123456789012:role/Admin\n"
+            "source_profile = default\n"
+            "[profile chained]\nsource_profile = admin\n"
+        )
+        credentials_file = tmp_path / "credentials"
+        credentials_file.write_text("[default]\naws_access_key_id = AKIA\n")
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(config_file))
+        monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(credentials_file))
+
+        details = {d["name"]: d["type"] for d in SessionManager().get_profile_details()}
+        assert details == {
+            "admin": "assume_role",
+            "chained": "chained",
+            "default": "static",
+            "sso": "sso",
+        }
+
+    def test_get_profile_details_cached_until_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that profile details are reused until a config file changes."""
+        config_file = tmp_path / "config"
+        config_file.write_text("[profile dev]\nrole_arn = arn:aws:iam::123456789012:role/Dev\n")
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(config_file))
+        monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(tmp_path / "credentials"))
+        manager = SessionManager()
+
+        _profile_types_cached.cache_clear()
+        first = manager.get_profile_details()
+        first[0]["type"] = "mutated"
+        assert manager.get_profile_details() == [{"name": "dev", "type": "assume_role"}]
+        assert _profile_types_cached.cache_info().hits == 1
+
+        config_file.write_text("[profile dev]\nsso_start_url = https://example.com/start\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert manager.get_profile_details() == [{"name": "dev", "type": "sso"}]
+
+
+class TestSessionManagerValidation:
+    """Tests for SessionManager credential validation."""
+
+    @pytest.mark.asyncio
+    async def test_validate_profiles_concurrently(
+        self, mock_aws_services: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that profiles are validated together without switching sessions."""
+        credentials_file = tmp_path / "credentials"
+        credentials_file.write_text(
+            "[dev]\naws_access_key_id = AKIADEV\naws_secret_access_key = secret\n"
+            "[prod]\naws_access_key_id = AKIAPROD\naws_secret_access_key = secret\n"
+        )
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(tmp_path / "config"))
+        monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(credentials_file))
+        manager = SessionManager()
+
+        results = await manager.validate_profiles(["dev", "prod", "missing"], "us-west-2")
+
+        assert results["dev"].profile == "dev"
+        assert results["prod"].region == "us-west-2"
+        assert isinstance(results["missing"], AuthenticationError)
+        assert manager.active_profile is None
+
+    def test_get_account_info_backs_off_after_failure(
+        self, session_manager: SessionManager
+    ) -> None:
+        """Test that a failed identity lookup is not retried on every call."""
+        sts = MagicMock()
+        sts.get_caller_identity.side_effect = NoCredentialsError()
+        session_manager.active_profile = "dev"
+
+        with patch.object(SessionManager, "get_client", return_value=sts):
+            assert session_manager.get_account_info() is None
+            assert session_manager.get_account_info() is None
+            assert sts.get_caller_identity.call_count == 1
+
+            sts.get_caller_identity.side_effect = None
+            sts.get_caller_identity.return_value = {
+                "Account": "123456789012",
+                "UserId": "AIDA",
+                "Arn": "arn:aws:iam::123456789012:user/dev",
+            }
+            info = session_manager.get_account_info(force_refresh=True)
+            assert info is not None and info.account_id == "123456789012"
+            assert session_manager.get_account_info() is info
+            assert sts.get_caller_identity.call_count == 2
+
+
+class TestCreateSession:
+    """Tests for the create_session helper."""
+
+    def test_assume_role_provider_uses_cli_cache(self, aws_credentials: None) -> None:
+        """Test that assumed-role credentials are cached on disk."""
+        session = create_session(region="us-west-2")
+        resolver = session._session.get_component("credential_provider")
+        provider = resolver.get_provider("assume-role")
+        assert isinstance(provider.cache, JSONFileCache)
+        assert session.region_name == "us-west-2"
+
+    def test_sessions_share_data_loader(self, aws_credentials: None) -> None:
+        """Test that new sessions reuse already-loaded botocore data."""
+        first = create_session(region="us-east-1")
+        second = create_session(region="eu-west-1")
+        assert first._session.get_component("data_loader") is second._session.get_component(
+            "data_loader"
+        )